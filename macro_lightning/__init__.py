@@ -41,12 +41,44 @@ from ._astropy_init import *  # noqa
 from ._astropy_init import __version__  # noqa
 
 
+# BUILT-IN
+
+import importlib
+import sys
+
+
 # PROJECT-SPECIFIC
 
-from . import data, utils, parameters, physics, plot
+from . import parameters
 
 from .parameters import solar_system_vesc_params
-from .plot import constraints_plot
+
+
+# -------------------------------------------------------------------
+# the remaining modules are imported on first access (PEP 562), since
+# `plot` pulls in matplotlib, which is slow to import.
+
+_lazy_modules = {"data", "utils", "physics", "plot"}
+
+
+def __getattr__(name: str):
+    """Import `_lazy_modules` and `constraints_plot` on first access."""
+    if name in _lazy_modules:
+        return importlib.import_module("." + name, __name__)
+    elif name == "constraints_plot":
+        from .plot import constraints_plot
+
+        return constraints_plot
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# /def
+
+
+if sys.version_info < (3, 7):  # no module __getattr__
+    from . import data, utils, physics, plot
+    from .plot import constraints_plot
 
 
 ##############################################################################
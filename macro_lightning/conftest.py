@@ -10,6 +10,8 @@ packagename.test
 import os
 import pytest
 
+import matplotlib
+
 from astropy.version import version as astropy_version
 
 # For Astropy 3.0 and later, we can use the standalone pytest plugin
@@ -57,6 +59,10 @@ def pytest_configure(config):
 # ------------------------------------------------------
 # Added by @nstarman
 
+# the non-interactive backend, as used by the image comparisons, so the tests
+# (and doctests) do not start a GUI toolkit.
+matplotlib.use("Agg")
+
 
 @pytest.fixture(autouse=True)
 def add_units(doctest_namespace):
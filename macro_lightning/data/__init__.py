@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
 # see LICENSE.rst
 
-"""Data Loading Functions."""
+"""Data Loading Functions.
+
+The loaders are cached: each data file is read once and the returned arrays
+are shared, read-only, between calls. Copy them before modifying.
+
+The polygon vertices are memory-mapped from ``.npy`` files and the
+constraint curves are loaded from ``.npz`` files, all built from the text
+(``.txt``, ``.ecsv``) files by ``scripts/build_data.py``. The text files
+remain the ground truth.
+
+"""
 
 
 __all__ = [
@@ -17,14 +27,16 @@ __all__ = [
 
 # BUILT IN
 
+import functools
+import io
 import pathlib
+import re
 import typing as T
 
 
 # THIRD PARTY
 
 import numpy as np
-from astropy.table import Table
 
 
 # PROJECT-SPECIFIC
@@ -41,6 +53,118 @@ _data_dir = pathlib.Path(__file__).parent
 ##############################################################################
 
 
+def _read_text_array(
+    path: pathlib.Path, delimiter: T.Optional[str] = None, skiprows: int = 0
+) -> np.ndarray:
+    """Read a delimited text file of floats into an array.
+
+    The file is read into memory in one call and parsed by the C tokenizer
+    of :func:`pandas.read_csv` when pandas is installed, falling back to
+    :func:`numpy.fromstring`.
+
+    Parameters
+    ----------
+    path : `~pathlib.Path`
+    delimiter : str or None, optional
+        The column delimiter. None (default) is any whitespace.
+    skiprows : int, optional
+        Number of leading lines to skip.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+
+    """
+    raw = path.read_bytes()
+    for _ in range(skiprows):
+        raw = raw.partition(b"\n")[2]
+
+    try:
+        import pandas as pd
+    except ImportError:
+        text = raw.decode()
+        if delimiter is not None:
+            text = text.replace(delimiter, " ")
+        ncols = len(text.partition("\n")[0].split())
+        return np.fromstring(text, sep=" ").reshape(-1, ncols)
+
+    df = pd.read_csv(
+        io.BytesIO(raw),
+        sep=r"\s+" if delimiter is None else delimiter,
+        header=None,
+        skipinitialspace=True,
+        dtype=np.float64,
+        engine="c",
+        float_precision="round_trip",
+    )
+    return df.to_numpy()
+
+
+# /def
+
+
+def _ecsv_columns(
+    path: pathlib.Path, names: T.Sequence[str]
+) -> T.Tuple[np.ndarray, ...]:
+    """Read columns from a whitespace-delimited ECSV file of floats.
+
+    The YAML header is only scanned for the column order, skipping the
+    full :class:`~astropy.table.Table` reader.
+
+    Parameters
+    ----------
+    path : `~pathlib.Path`
+    names : Sequence[str]
+        The columns to return, in order.
+
+    Returns
+    -------
+    tuple of :class:`~numpy.ndarray`
+
+    """
+    header = []
+    with open(path, "r") as file:
+        for line in file:
+            if not line.startswith("#"):  # the column names row
+                break
+            header.append(line)
+
+    columns = re.findall(r"name:\s*([^,}\s]+)", "".join(header))
+    arr = _read_text_array(path, skiprows=len(header) + 1)
+
+    return tuple(
+        np.ascontiguousarray(arr[:, columns.index(name)]) for name in names
+    )
+
+
+# /def
+
+
+def _read_only(*arrays: np.ndarray):
+    """Flag arrays as read-only, since loaders share a cached instance.
+
+    Parameters
+    ----------
+    *arrays : :class:`~numpy.ndarray`
+
+    Returns
+    -------
+    :class:`~numpy.ndarray` or tuple thereof
+        a single array if only one was passed
+
+    """
+    for arr in arrays:
+        arr.setflags(write=False)
+
+    return arrays[0] if len(arrays) == 1 else arrays
+
+
+# /def
+
+# -------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=None)
 def load_mica_constraints() -> T.Sequence:
     r"""Mica Polygon Vertices.
 
@@ -69,11 +193,9 @@ def load_mica_constraints() -> T.Sequence:
     :func:`~macro_lightning.plot.plot_mica_constraints`
 
     """
-    points = np.loadtxt(
-        _data_dir.joinpath("mica_polygon.txt"), delimiter=",", skiprows=1
-    )
+    points = np.load(_data_dir.joinpath("mica_polygon.npy"), mmap_mode="r")
 
-    return points
+    return _read_only(points)
 
 
 # /def
@@ -81,6 +203,7 @@ def load_mica_constraints() -> T.Sequence:
 # -------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def load_superbursts_polygons() -> T.Tuple[T.Sequence, T.Sequence]:
     """Superbursts Polygon Vertices.
 
@@ -108,11 +231,15 @@ def load_superbursts_polygons() -> T.Tuple[T.Sequence, T.Sequence]:
     :func:`~macro_lightning.plot.plot_superbursts_constraints`
 
     """
-    points1 = np.loadtxt(_data_dir.joinpath("superbursts1_polygon.txt"))
+    points1 = np.load(
+        _data_dir.joinpath("superbursts1_polygon.npy"), mmap_mode="r"
+    )
 
-    points2 = np.loadtxt(_data_dir.joinpath("superbursts2_polygon.txt"))
+    points2 = np.load(
+        _data_dir.joinpath("superbursts2_polygon.npy"), mmap_mode="r"
+    )
 
-    return points1, points2
+    return _read_only(points1, points2)
 
 
 # /def
@@ -121,6 +248,7 @@ def load_superbursts_polygons() -> T.Tuple[T.Sequence, T.Sequence]:
 # -------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def load_humandeath_constraints() -> T.Tuple[
     T.Sequence, T.Sequence, T.Sequence
 ]:
@@ -155,11 +283,10 @@ def load_humandeath_constraints() -> T.Tuple[
     :func:`~macro_lightning.plot.plot_humandeath_constraints`
 
     """
-    data = Table.read(
-        _data_dir.joinpath("humandeath_constraints.ecsv"), format="ascii.ecsv"
-    )
+    with np.load(_data_dir.joinpath("humandeath_constraints.npz")) as data:
+        mass, xsec, upper = data["mass"], data["xsec"], data["upper"]
 
-    return data["mass"], data["cross-section"], data["upper-lim"]
+    return _read_only(mass, xsec, upper)
 
 
 # /def
@@ -167,6 +294,7 @@ def load_humandeath_constraints() -> T.Tuple[
 # -------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def load_dfn_constraints() -> T.Tuple[T.Sequence, T.Sequence, T.Sequence]:
     r"""Constraint data from Desert Fireball Network (DFN).
 
@@ -196,11 +324,10 @@ def load_dfn_constraints() -> T.Tuple[T.Sequence, T.Sequence, T.Sequence]:
     :func:`~macro_lightning.plot.plot_dfn_constraints`
 
     """
-    data = Table.read(
-        _data_dir.joinpath("dfn_constraints.ecsv"), format="ascii.ecsv"
-    )
+    with np.load(_data_dir.joinpath("dfn_constraints.npz")) as data:
+        mass, xsec, upper = data["mass"], data["xsec"], data["upper"]
 
-    return data["mass"], data["cross-section"], data["upper-lim"]
+    return _read_only(mass, xsec, upper)
 
 
 # /def
@@ -208,6 +335,7 @@ def load_dfn_constraints() -> T.Tuple[T.Sequence, T.Sequence, T.Sequence]:
 # -------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def load_dfn_future_constraints() -> T.Tuple[
     T.Sequence, T.Sequence, T.Sequence
 ]:
@@ -235,11 +363,10 @@ def load_dfn_future_constraints() -> T.Tuple[
         10.1103/physrevd.100.123008.
 
     """
-    data = Table.read(
-        _data_dir.joinpath("dfn_future_constraints.ecsv"), format="ascii.ecsv"
-    )
+    with np.load(_data_dir.joinpath("dfn_future_constraints.npz")) as data:
+        mass, xsec, upper = data["mass"], data["xsec"], data["upper"]
 
-    return data["mass"], data["cross-section"], data["upper-lim"]
+    return _read_only(mass, xsec, upper)
 
 
 # /def
@@ -247,6 +374,7 @@ def load_dfn_future_constraints() -> T.Tuple[
 # -------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def load_whitedwarf_constraints() -> T.Sequence:
     r"""Constraint data from the existence of massive White Dwarfs.
 
@@ -277,9 +405,11 @@ def load_whitedwarf_constraints() -> T.Sequence:
     :func:`~macro_lightning.plot.plot_white_dwarf_constraints`
 
     """
-    points = np.loadtxt(_data_dir.joinpath("whitedwarf_polygon.txt"))
+    points = np.load(
+        _data_dir.joinpath("whitedwarf_polygon.npy"), mmap_mode="r"
+    )
 
-    return points
+    return _read_only(points)
 
 
 # /def
@@ -45,6 +45,24 @@ _ref_D = (
     "on cartographic coordinates and rotational elements: 2015' "
     "Celestial Mech. Dyn. Astr. 130:22."
 )
+_BCD_REFS = (_ref_B, _ref_C, _ref_D)  # shared by all default bodies
+
+# default escape velocities, stored as one array (see the references below)
+_DEFAULT_NAMES = (
+    "Sun",
+    "Mercury",
+    "Venus",
+    "Earth",
+    "Mars",
+    "Jupiter",
+    "Saturn",
+    "Uranus",
+    "Neptune",
+    "Pluto",
+)
+_DEFAULT_VESC = u.Quantity(
+    [617.5, 4.25, 10.36, 11.19, 5.03, 60.20, 36.09, 21.38, 23.56, 1.21], _KMS
+)
 
 
 ##############################################################################
@@ -61,50 +79,26 @@ class solar_system_vesc_params(ScienceState):
 
     _registry = {
         "DEFAULT": {
-            "params": {
-                "Sun": 617.5 * _KMS,
-                "Mercury": 4.25 * _KMS,
-                "Venus": 10.36 * _KMS,
-                "Earth": 11.19 * _KMS,
-                "Mars": 5.03 * _KMS,
-                "Jupiter": 60.20 * _KMS,
-                "Saturn": 36.09 * _KMS,
-                "Uranus": 21.38 * _KMS,
-                "Neptune": 23.56 * _KMS,
-                "Pluto": 1.21 * _KMS,
-            },
+            "params": dict(zip(_DEFAULT_NAMES, _DEFAULT_VESC)),
             "references": {
                 "_source": "https://ssd.jpl.nasa.gov/?planet_phys_par",
-                "Sun": (_ref_B, _ref_C, _ref_D),
-                "Mercury": (_ref_B, _ref_C, _ref_D),
-                "Venus": (_ref_B, _ref_C, _ref_D),
-                "Earth": (_ref_B, _ref_C, _ref_D),
-                "Mars": (_ref_B, _ref_C, _ref_D),
-                "Jupiter": (_ref_B, _ref_C, _ref_D),
-                "Saturn": (_ref_B, _ref_C, _ref_D),
-                "Uranus": (_ref_B, _ref_C, _ref_D),
-                "Neptune": (_ref_B, _ref_C, _ref_D),
-                "Pluto": (_ref_B, _ref_C, _ref_D),
+                **{name: _BCD_REFS for name in _DEFAULT_NAMES},
             },
         }
     }
+    # `_registry`, keyed by the lower-cased name, for string lookups
+    _canonical = {k.lower(): v for k, v in _registry.items()}
 
     @classmethod
     def get_solar_params_from_string(cls, arg):
-        """Get parameters from registry."""
+        """Get parameters from registry. Names are case-insensitive."""
         # Resolve the meaning of 'latest'
         if arg == "latest":
             arg = cls._latest_value
 
-        if arg.lower() == "default":
-
-            info = cls._registry["DEFAULT"]
+        info = cls._canonical.get(arg.lower())
 
-        elif arg in cls._registry:
-
-            info = cls._registry[arg]
-
-        else:
+        if info is None:
             raise ValueError(
                 f"Invalid string input to retrieve solar "
                 f'parameters for Galactocentric frame: "{arg}"'
@@ -143,11 +137,27 @@ class solar_system_vesc_params(ScienceState):
         Parameters
         ----------
         name : str
+            Lookups are case-insensitive, so `name` may only differ in case
+            from a registered name if it is that name.
         params : dict
         references : dict
 
+        Raises
+        ------
+        ValueError
+            if `name` differs only in case from a registered name.
+
         """
-        cls._registry[name] = {"params": params, "references": references}
+        for key in cls._registry:
+            if key != name and key.lower() == name.lower():
+                raise ValueError(
+                    f'"{name}" differs only in case from the registered '
+                    f'"{key}". Names are case-insensitive.'
+                )
+
+        info = {"params": params, "references": references}
+        cls._registry[name] = info
+        cls._canonical[name.lower()] = info
 
     # /def
 
@@ -169,13 +179,10 @@ class solar_system_vesc_params(ScienceState):
             references for `value`. Only used if `register_as` is str.
 
         """
-        super().set(value)
+        if isinstance(register_as, str):  # first, as it can raise
+            cls.register(register_as, value, references or {})
 
-        if isinstance(register_as, str):
-            cls._registry[register_as] = {
-                "params": value,
-                "references": references or {},
-            }
+        super().set(value)
 
     # /def
 
@@ -183,14 +190,36 @@ class solar_system_vesc_params(ScienceState):
 # -------------------------------------------------------------------
 
 
-vesc_sun_at_earth = (
-    42.1 * _KMS
-)  # https://en.wikipedia.org/wiki/Escape_velocity
+_VESC_EARTH_KMS = 42.1  # https://en.wikipedia.org/wiki/Escape_velocity
+
+vesc_sun_at_earth = u.Quantity(_VESC_EARTH_KMS, _KMS)
 
 
 # -------------------------------------------------------------------
 
 
+def _vesc_sun_at_R_AU(R_AU):
+    """Unitless :func:`~vesc_sun_at_R`, for inner loops.
+
+    Parameters
+    ----------
+    R_AU : float or ndarray
+        Distance from the sun, in AU.
+
+    Returns
+    -------
+    vesc : float or ndarray
+        In km / s.
+
+    """
+    vesc = np.sqrt(R_AU)  # b/c r_earth = 1 AU
+    buf = vesc if isinstance(vesc, np.ndarray) else None  # None for scalars
+    return np.multiply(vesc, _VESC_EARTH_KMS, out=buf)
+
+
+# /def
+
+
 @u.quantity_input(R="length")
 def vesc_sun_at_R(R):
     r"""Escape velocity from the sun, starting at position R.
@@ -211,8 +240,8 @@ def vesc_sun_at_R(R):
     vesc : Quantity
 
     """
-    ratio = R.to_value(u.AU)  # b/c r_earth = 1 AU
-    return np.sqrt(ratio) * vesc_sun_at_earth
+    vesc = _vesc_sun_at_R_AU(R.to_value(u.AU))
+    return u.Quantity(vesc, _KMS, copy=False)
 
 
 # /def
@@ -15,6 +15,7 @@ __all__ = [
     "calculate_Mx",
     "calculate_Sx",
     "calculate_Mx_and_Sx",
+    "clear_velocity_grid_cache",
 ]
 
 
@@ -23,9 +24,10 @@ __all__ = [
 
 # BUILT-IN
 
-import itertools
 import functools
+import os
 import typing as T
+from concurrent.futures import ThreadPoolExecutor
 
 # THIRD PARTY
 
@@ -34,12 +36,10 @@ from astropy.utils.decorators import format_doc
 
 import numpy as np
 
-from tqdm import tqdm
-
 
 # PROJECT-SPECIFIC
 
-from .utils import as_quantity, qnorm
+from .utils import as_quantity
 
 
 ##############################################################################
@@ -48,6 +48,28 @@ from .utils import as_quantity, qnorm
 _KMS = u.km / u.s
 
 _sqrt2 = np.sqrt(2)
+_INV_SQRT2 = 1 / _sqrt2
+
+# fraction of the escape velocity left over from a circular orbit
+_K_CIRCULAR = 1 - 1 / _sqrt2
+
+# Maxwellian normalization
+_INV_PI_3_2 = 1.0 / np.pi ** 1.5
+
+# elements per block of the velocity grid, ~1 MB of float64
+_BLOCK_SIZE = 2 ** 17
+
+# inverse volumes [cm^-3] of nuclear and atomic density objects per gram
+_NUC_INV_VOL = 1.0 / (4.0 / 3.0 * np.pi * 3.6e14)
+_ATM_INV_VOL = 1.0 / (4.0 / 3.0 * np.pi)
+
+# Schwarzschild cross-section per gram^2: pi (3 km / M_sun)^2
+_BH_COEFF = np.pi * (3e5) ** 2 / (2e33) ** 2
+
+# slopes [cm^2 / g] of the linear cross-section bounds
+_CMB_K = 4.5e-7
+_KEPLER_K = 1e-6
+_LMC_K = 1e-4
 
 
 ##############################################################################
@@ -55,14 +77,21 @@ _sqrt2 = np.sqrt(2)
 ##############################################################################
 
 
-def CMB(M: T.Sequence) -> T.Sequence:
+def CMB(M: T.Sequence, out: T.Optional[np.ndarray] = None) -> T.Sequence:
     r"""CMB bound from Celine Boehm paper
 
     Paper considers dark matter elastic scattering effects on the CMB.
     :math:`sigma_x/M_x \geq 4.5e-7` is ruled out.
 
+    Parameters
+    ----------
+    M : Sequence
+        mass [g]
+    out : ndarray, optional
+        buffer, of the shape of `M`, in which to place the result.
+
     """
-    return M * 4.5e-7
+    return np.multiply(M, _CMB_K, out=out)
 
 
 # /def
@@ -71,11 +100,40 @@ def CMB(M: T.Sequence) -> T.Sequence:
 # -------------------------------------------------------------------
 
 
-def nuclear_density(M: T.Sequence) -> T.Sequence:
-    """Quantity sigma_x(cross-section) for a nuclear density object."""
-    volume = 4.0 / 3.0 * np.pi * 3.6e14
-    out = np.pi * np.power(M / volume, 2.0 / 3)
-    return out
+def _constant_density_xsec(
+    M: T.Sequence, inv_vol: float, out: T.Optional[np.ndarray] = None
+) -> T.Sequence:
+    r"""Cross-section :math:`\pi (M / V)^{2/3}` of a constant-density object.
+
+    The power is taken as the square of :func:`~numpy.cbrt`, which is
+    cheaper than the general :func:`~numpy.power`. The result is computed in
+    one buffer (`out`, if given), updated in-place.
+
+    """
+    xsec = np.multiply(M, inv_vol, out=out, dtype=np.float64)
+    buf = xsec if isinstance(xsec, np.ndarray) else None  # None for scalars
+    xsec = np.cbrt(xsec, out=buf)
+    xsec = np.square(xsec, out=buf)
+    return np.multiply(xsec, np.pi, out=buf)
+
+
+# /def
+
+
+def nuclear_density(
+    M: T.Sequence, out: T.Optional[np.ndarray] = None
+) -> T.Sequence:
+    """Quantity sigma_x(cross-section) for a nuclear density object.
+
+    Parameters
+    ----------
+    M : Sequence
+        mass [g]
+    out : ndarray, optional
+        buffer, of the shape of `M`, in which to place the result.
+
+    """
+    return _constant_density_xsec(M, _NUC_INV_VOL, out=out)
 
 
 # /def
@@ -84,9 +142,22 @@ def nuclear_density(M: T.Sequence) -> T.Sequence:
 # -------------------------------------------------------------------
 
 
-def black_hole(M: T.Sequence) -> T.Sequence:
-    """Cross section by mass satisfying the Schwarzchild radius."""
-    return np.pi * (3e5) ** 2 * (M / (2e33)) ** 2.0
+def black_hole(
+    M: T.Sequence, out: T.Optional[np.ndarray] = None
+) -> T.Sequence:
+    """Cross section by mass satisfying the Schwarzchild radius.
+
+    Parameters
+    ----------
+    M : Sequence
+        mass [g]
+    out : ndarray, optional
+        buffer, of the shape of `M`, in which to place the result.
+
+    """
+    xsec = np.square(M, out=out, dtype=np.float64)  # no integer overflow
+    buf = xsec if isinstance(xsec, np.ndarray) else None  # None for scalars
+    return np.multiply(xsec, _BH_COEFF, out=buf)
 
 
 # /def
@@ -95,11 +166,20 @@ def black_hole(M: T.Sequence) -> T.Sequence:
 # -------------------------------------------------------------------
 
 
-def atomic_density(M: T.Sequence) -> T.Sequence:
-    """Quantity sigma_x(cross-section) for an atomic density object."""
-    volume = 4.0 / 3.0 * np.pi * 1e0
-    out = np.pi * np.power(M / volume, 2.0 / 3.0)
-    return out
+def atomic_density(
+    M: T.Sequence, out: T.Optional[np.ndarray] = None
+) -> T.Sequence:
+    """Quantity sigma_x(cross-section) for an atomic density object.
+
+    Parameters
+    ----------
+    M : Sequence
+        mass [g]
+    out : ndarray, optional
+        buffer, of the shape of `M`, in which to place the result.
+
+    """
+    return _constant_density_xsec(M, _ATM_INV_VOL, out=out)
 
 
 # /def
@@ -108,9 +188,20 @@ def atomic_density(M: T.Sequence) -> T.Sequence:
 # -------------------------------------------------------------------
 
 
-def KeplerTop(M: T.Sequence) -> T.Sequence:
-    """Microlensing bounds from Kepler."""
-    return 1e-6 * M
+def KeplerTop(
+    M: T.Sequence, out: T.Optional[np.ndarray] = None
+) -> T.Sequence:
+    """Microlensing bounds from Kepler.
+
+    Parameters
+    ----------
+    M : Sequence
+        mass [g]
+    out : ndarray, optional
+        buffer, of the shape of `M`, in which to place the result.
+
+    """
+    return np.multiply(M, _KEPLER_K, out=out)
 
 
 # /def
@@ -119,9 +210,18 @@ def KeplerTop(M: T.Sequence) -> T.Sequence:
 # -------------------------------------------------------------------
 
 
-def LMCTop(M: T.Sequence) -> T.Sequence:
-    """Microlensing bounds from observation of the LMC."""
-    return 1e-4 * M
+def LMCTop(M: T.Sequence, out: T.Optional[np.ndarray] = None) -> T.Sequence:
+    """Microlensing bounds from observation of the LMC.
+
+    Parameters
+    ----------
+    M : Sequence
+        mass [g]
+    out : ndarray, optional
+        buffer, of the shape of `M`, in which to place the result.
+
+    """
+    return np.multiply(M, _LMC_K, out=out)
 
 
 # /def
@@ -154,23 +254,38 @@ def f_BM_bin(vx, vbin, vvir):
          100(2019), 10.1103/physrevd.100.123008.
 
     """
-    norm = (vbin / vvir) ** 3 / np.power(np.pi, 3.0 / 2.0)
-    exp = np.exp(-np.square(vx / vvir))
+    norm = (vbin / vvir) ** 3 * _INV_PI_3_2
 
-    return norm * exp
+    return _f_BM_bin_kernel(np.square(vx), 1.0 / np.square(vvir), norm)
 
 
 # /def
 
-# -------------------------------------------------------------------
 
+def _f_BM_bin_kernel(speed2, inv_vvir2, norm):
+    r""":func:`f_BM_bin` with the invariant factors precomputed.
+
+    Parameters
+    ----------
+    speed2 : array-like
+        The squared speed.
+    inv_vvir2 : array-like
+        The inverse square of the virial velocity.
+    norm : array-like
+        :math:`(v_{bin} / v_{vir})^3 / \pi^{3/2}`
 
-def _norm_v1_v2(v1: T.Sequence, v2: T.Sequence) -> T.Sequence:
-    return np.sqrt(v1 ** 2.0 + v2 ** 2.0)
+    Returns
+    -------
+    array-like
+
+    """
+    return norm * np.exp(-speed2 * inv_vvir2)
 
 
 # /def
 
+# -------------------------------------------------------------------
+
 
 _multibody_escape_wikipedia = r"""
     When escaping a compound system, such as a moon orbiting a planet or a
@@ -245,9 +360,41 @@ def twobody_vesc(
     :func:`~macro_lightning.physics.multibody_vesc`
 
     """
-    vo = vo or ve2 / _sqrt2  # None -> circular
+    if vo is None:  # circular
+        vo = ve2 * _INV_SQRT2
+
+    return np.hypot(ve1, ve2 - vo)
+
+
+# /def
+
+
+@functools.lru_cache(maxsize=128)
+def _multibody_vesc_scalar(
+    vescs: T.Tuple[float, ...],
+    vo: T.Optional[T.Tuple[float, ...]],
+    accumulate: bool,
+):
+    """:func:`multibody_vesc` on scalars, in the units of ``vescs[0]``.
+
+    Returns
+    -------
+    float or tuple of float
+        A tuple if `accumulate`, so that the cached result is immutable.
+
+    """
+    vs = np.array(vescs)
 
-    return np.sqrt(ve1 ** 2 + (ve2 - vo) ** 2)
+    if vo is None:
+        vs[1:] *= _K_CIRCULAR
+    else:
+        vs[1:] -= vo
+
+    vs2 = np.square(vs, out=vs)
+    if accumulate:
+        return tuple(np.sqrt(np.cumsum(vs2)).tolist())
+    else:
+        return float(np.sqrt(np.sum(vs2)))
 
 
 # /def
@@ -305,17 +452,438 @@ def multibody_vesc(
     :func:`~macro_lightning.physics.twobody_vesc`
 
     """
+    # scalars are hashable as floats, so the reduction is cached
+    if all(np.ndim(v) == 0 for v in vescs) and np.ndim(vo) <= 1:
+        qs = [as_quantity(v) for v in vescs]  # plain floats: dimensionless
+        unit = qs[0].unit
+        if vo is not None:
+            vo = tuple(np.atleast_1d(as_quantity(vo).to_value(unit)).tolist())
+        vesc = _multibody_vesc_scalar(
+            tuple(float(q.to_value(unit)) for q in qs), vo, accumulate
+        )
+        return u.Quantity(vesc, unit)
+
+    # a new, writable, float array, since `vescs` is a tuple
     vs: u.Quantity = as_quantity(vescs)
 
     if vo is None:
-        vs[1:] = vs[1:] * (1 - 1 / np.sqrt(2))
+        vs[1:] *= _K_CIRCULAR
     else:
-        vs[1:] = vs[1:] - vo
+        vs[1:] -= vo
 
+    # reduce over the bodies only, the first axis
+    vs2 = np.square(vs, out=vs)
     if accumulate:
-        return as_quantity(itertools.accumulate(vs, _norm_v1_v2))
+        return np.sqrt(np.cumsum(vs2, axis=0))
+    else:
+        return np.sqrt(np.sum(vs2, axis=0))
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _to_kms(*speeds):
+    """The values of `speeds`, in km / s. Scalars are Python floats."""
+    return tuple(_value(v, _KMS) for v in speeds)
+
+
+# /def
+
+
+def _value(q, unit):
+    """The value of `q` in `unit`, as a Python float if scalar.
+
+    Python floats, unlike NumPy scalars, never upcast the dtype of the
+    arrays they are combined with.
+
+    """
+    value = q.to_value(unit)
+    return float(value) if np.ndim(value) == 0 else value
+
+
+# /def
+
+
+def _working_dtype(dtype):
+    """`dtype` as a :class:`numpy.dtype`, checking it is float32 or float64.
+
+    Raises
+    ------
+    ValueError
+        if `dtype` is not float32 or float64. Integer dtypes truncate the
+        velocity grid and float16 is too coarse for the integrals.
+
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"dtype must be float32 or float64, not {dtype}.")
+    return dtype
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _bound_velocities_block(v, v2, yz2, vesc2, start, stop):
+    """:func:`_bound_velocities` for the block ``v[start:stop]`` of `vx`."""
+    speed2 = np.add.outer(v2[start:stop], yz2)
+    inside = speed2 <= vesc2  # bound to the Galaxy
+
+    ix, iy, iz = np.nonzero(inside)
+    ix += start
+
+    return v[ix], v[iy], v[iz], speed2[inside]
+
+
+# /def
+
+
+def _bound_velocities(v, vesc):
+    """Velocities on the grid ``v`` x ``v`` x ``v`` bound to the Galaxy.
+
+    The grid is processed in blocks along the first axis, each sized to
+    stay in cache, and on multiple cores the blocks are evaluated in
+    threads (NumPy releases the GIL in its ufuncs).
+
+    Parameters
+    ----------
+    v : ndarray
+        velocities along one Cartesian component.
+    vesc : float
+        Galactocentric escape velocity, in the units of `v`.
+
+    Returns
+    -------
+    vx, vy, vz, speed2 : ndarray
+        The components and squared speed of the velocities within `vesc`,
+        in the order of ``itertools.product(v, v, v)``.
+
+    """
+    # squared speed on the grid, from outer sums of one axis so that only
+    # the blocks are N^3. C order matches itertools.product(vels, ...).
+    v2 = np.square(v)
+    yz2 = np.add.outer(v2, v2)
+    vesc2 = vesc ** 2
+
+    N = len(v)
+    rows = max(1, _BLOCK_SIZE // max(yz2.size, 1))
+    blocks = [(i, min(i + rows, N)) for i in range(0, N, rows)]
+
+    def evaluate(block):
+        return _bound_velocities_block(v, v2, yz2, vesc2, *block)
+
+    workers = min(len(blocks), os.cpu_count() or 1)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(evaluate, blocks))
     else:
-        return functools.reduce(_norm_v1_v2, vs)
+        parts = [evaluate(block) for block in blocks]
+
+    if len(parts) == 1:
+        return parts[0]
+    return tuple(np.concatenate(arrs) for arrs in zip(*parts))
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _cached_bound_velocities(v, vesc, dtype=np.float64):
+    """:func:`_bound_velocities`, cached on the values of `v` and `vesc`.
+
+    Repeated calls with a fixed `vels` grid, e.g. sweeping `vvir` or `Arho`,
+    skip rebuilding the grid. The returned arrays are read-only, of `dtype`.
+    Only the last grid is kept, see :func:`clear_velocity_grid_cache`.
+
+    """
+    v = np.ascontiguousarray(v, dtype=np.float64)
+    return _bound_velocities_from_bytes(
+        v.tobytes(), float(vesc), np.dtype(dtype).str
+    )
+
+
+# /def
+
+
+@functools.lru_cache(maxsize=1)
+def _bound_velocities_from_bytes(v_bytes, vesc, dtype):
+    """:func:`_cached_bound_velocities`, keyed on hashable arguments."""
+    v = np.frombuffer(v_bytes).astype(dtype, copy=False)
+    bound = _bound_velocities(v, vesc)
+    for arr in bound:
+        arr.setflags(write=False)
+    return bound
+
+
+# /def
+
+
+def clear_velocity_grid_cache():
+    """Free the velocity grid kept by the ``calculate_*`` functions.
+
+    :func:`calculate_Mx`, :func:`calculate_Sx`, and
+    :func:`calculate_Mx_and_Sx` keep the bound velocities of the last
+    `vels` grid, several arrays of up to ``len(vels)**3`` elements, so that
+    sweeps over the other parameters skip rebuilding it.
+
+    """
+    _bound_velocities_from_bytes.cache_clear()
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _relative_speed(vx, vy, vz, vcirc, vmin):
+    """Speed of a macro relative to the Earth, after infall.
+
+    Parameters
+    ----------
+    vx, vy, vz : ndarray
+        Galactocentric velocity components.
+    vcirc, vmin : float
+        Galactocentric circular velocity and the infall velocity to the
+        Earth, in the units of `vx`.
+
+    Returns
+    -------
+    vrel : ndarray
+
+    """
+    vrel = vy - vcirc
+    np.square(vrel, out=vrel)
+    vrel += vmin ** 2 + vx ** 2 + vz ** 2
+    return np.sqrt(vrel, out=vrel)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _velocity_step(v):
+    """The step between the velocities `v`.
+
+    Raises
+    ------
+    ValueError
+        if the steps in `v` are unequal.
+
+    """
+    steps = np.diff(v)
+    vstep = np.abs(steps[0])  # positive
+
+    # the spread of the steps, in one reduction
+    if np.ptp(steps) > 1e-8 + 1e-5 * vstep:
+        raise ValueError("vels steps unequal in size.")
+
+    return float(vstep)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _Mx_from_vrel(speed2, vrel, vstep, vvir, Arho):
+    """Integrate Mx over bound velocities.
+
+    Parameters
+    ----------
+    speed2, vrel : ndarray
+        Squared Galactocentric speed and relative speed of each velocity.
+    vstep, vvir : float
+        [km / s]
+    Arho : float
+        [m_unit s / km]
+
+    Returns
+    -------
+    Mxs : ndarray
+    vbar, Vhold : float
+
+    """
+    # f_BM_bin(speed, vbin=vstep, vvir=vvir), without units
+    norm = (vstep / vvir) ** 3 * _INV_PI_3_2
+    Mxs = _f_BM_bin_kernel(speed2, 1.0 / vvir ** 2, norm)
+
+    Mxs *= vrel
+    np.cumsum(Mxs, out=Mxs)  # vbar, cumulatively
+    vbar = Mxs[-1]
+
+    # the product of the A_{det} and rho_{DM} and T, the integration
+    # time, outside the integral in equation of 4 of the bolides
+    # paper.
+    Mxs *= Arho
+
+    return Mxs, vbar, vrel[-1]
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _Sx_from_vrel(vrel, vhold, minsigma, sigma_factor):
+    """Minimum detectable Sx over bound velocities.
+
+    Parameters
+    ----------
+    vrel : ndarray
+        Relative speed of each velocity [km / s]
+    vhold : float
+        [km / s]
+    minsigma : float
+        [sig_unit]
+    sigma_factor : float
+        [sig_unit km^2 / s^2]
+
+    Returns
+    -------
+    Sxs : ndarray
+    vhold : float
+
+    """
+    # vhold is never reset, so it is the running minimum of vrel
+    Sxs = np.minimum.accumulate(vrel)
+    np.minimum(Sxs, vhold, out=Sxs)
+    if len(Sxs):
+        vhold = Sxs[-1]
+
+    np.square(Sxs, out=Sxs)
+    np.divide(sigma_factor, Sxs, out=Sxs)
+    np.maximum(Sxs, minsigma, out=Sxs)
+
+    return Sxs, vhold
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _Mx_kernel(v, vvir, vesc, vcirc, vmin, Arho, dtype=np.float64):
+    """:func:`calculate_Mx` on unitless arrays.
+
+    Parameters
+    ----------
+    v : ndarray
+        evenly spaced velocities [km / s]
+    vvir, vesc, vcirc, vmin : float
+        [km / s]
+    Arho : float
+        [m_unit s / km]
+    dtype : dtype, optional
+        of the velocity grid and `Mxs`.
+
+    Returns
+    -------
+    Mxs : ndarray
+    vbar, Vhold : float
+
+    Raises
+    ------
+    ValueError
+        if the steps in `v` are unequal.
+
+    """
+    vstep = _velocity_step(v)
+    vx, vy, vz, speed2 = _cached_bound_velocities(v, vesc, dtype)
+    vrel = _relative_speed(vx, vy, vz, vcirc, vmin)
+
+    return _Mx_from_vrel(speed2, vrel, vstep, vvir, Arho)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _Sx_kernel(
+    v, vesc, vhold, vcirc, vmin, minsigma, sigma_factor, dtype=np.float64
+):
+    """:func:`calculate_Sx` on unitless arrays.
+
+    Parameters
+    ----------
+    v : ndarray
+        velocities [km / s]
+    vesc, vhold, vcirc, vmin : float
+        [km / s]
+    minsigma : float
+        [sig_unit]
+    sigma_factor : float
+        [sig_unit km^2 / s^2]
+    dtype : dtype, optional
+        of the velocity grid and `Sxs`.
+
+    Returns
+    -------
+    Sxs : ndarray
+    vhold : float
+
+    """
+    vx, vy, vz, _ = _cached_bound_velocities(v, vesc, dtype)
+    vrel = _relative_speed(vx, vy, vz, vcirc, vmin)
+
+    return _Sx_from_vrel(vrel, vhold, minsigma, sigma_factor)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _Mx_Sx_kernel(
+    v,
+    vvir,
+    vesc,
+    vcirc,
+    vmin,
+    Arho,
+    minsigma,
+    sigma_factor,
+    dtype=np.float64,
+):
+    """:func:`calculate_Mx_and_Sx` on unitless arrays.
+
+    The bound velocities and their relative speeds are computed once and
+    shared by both integrals.
+
+    Returns
+    -------
+    Mxs, Sxs : ndarray
+    vbar, vhold : float
+
+    Raises
+    ------
+    ValueError
+        if the steps in `v` are unequal.
+
+    """
+    vstep = _velocity_step(v)
+    vx, vy, vz, speed2 = _cached_bound_velocities(v, vesc, dtype)
+    vrel = _relative_speed(vx, vy, vz, vcirc, vmin)
+
+    Mxs, vbar, Vhold = _Mx_from_vrel(speed2, vrel, vstep, vvir, Arho)
+    Sxs, vhold = _Sx_from_vrel(vrel, Vhold, minsigma, sigma_factor)
+
+    return Mxs, Sxs, vbar, vhold
 
 
 # /def
@@ -332,7 +900,9 @@ def multibody_vesc(
     vmin="speed",
     vcirc="speed",
 )
-def calculate_Mx(vels, vvir, vesc, vcirc, vmin, Arho, m_unit=u.g):
+def calculate_Mx(
+    vels, vvir, vesc, vcirc, vmin, Arho, m_unit=u.g, dtype=np.float64
+):
     """Calculate Mx.
 
     Mx is the array of M_x values corresponding to the minimum sigma_x values;
@@ -371,55 +941,54 @@ def calculate_Mx(vels, vvir, vesc, vcirc, vmin, Arho, m_unit=u.g):
     Other Parameters
     ----------------
     m_unit : :class:`~astropy.units.Unit`
+    dtype : dtype, optional
+        The working precision of the integration, float32 or float64. Single
+        precision (``numpy.float32``) halves the memory of large grids, at
+        the cost of accuracy in the cumulative sum. The results are always
+        float64.
 
     Notes
     -----
-    this integration can be very slow.
+    The integration is vectorized over the ``len(vels)**3`` velocity grid,
+    so memory, not time, limits the size of `vels`. The grid of the last
+    `vels` is kept between calls; free it with
+    :func:`clear_velocity_grid_cache`.
 
     """
-    vbar = 0.0 * u.km / u.s
-    Vhold = 800.0 * u.km / u.s
+    dtype = _working_dtype(dtype)
 
-    steps = np.diff(vels)
-    if not np.allclose(steps[:-1], steps[1:]):  # check all close
-        raise ValueError("vels steps unequal in size.")
-    else:
-        vstep = np.abs(steps[0])  # positive
+    # strip units, working in km / s
+    v, vvir, vesc, vcirc, vmin = _to_kms(vels, vvir, vesc, vcirc, vmin)
+    Arho = _value(Arho, m_unit / _KMS)
 
-    Mxs = np.zeros(len(vels) ** 3) * m_unit
-    iterator = itertools.product(vels, vels, vels)
+    Mxs, vbar, Vhold = _Mx_kernel(v, vvir, vesc, vcirc, vmin, Arho, dtype)
 
-    for i, (vx, vy, vz) in tqdm(enumerate(iterator), total=len(Mxs)):
-        if qnorm(vx, vy, vz) <= vesc:
-            maxwellian = f_BM_bin(qnorm(vx, vy, vz), vbin=vstep, vvir=vvir)
-            vrel = qnorm(vmin, vx, vy - vcirc, vz)
-
-            vbar = vbar + vrel * maxwellian  # cumulative
-
-            # the product of the A_{det} and rho_{DM} and T, the integration
-            # time, outside the integral in equation of 4 of the bolides
-            # paper.
-            mx = Arho * vbar
-
-            Mxs[i] = mx
-
-    # update variable
-    Vhold = vrel
-
-    # /for
-
-    Mxs = Mxs[Mxs > 0 * m_unit]
+    Mxs = u.Quantity(Mxs, m_unit, dtype=np.float64, copy=False)
+    vbar = u.Quantity(vbar, _KMS, dtype=np.float64)
+    Vhold = u.Quantity(Vhold, _KMS, dtype=np.float64)
 
     return Mxs, vbar, Vhold
 
 
 # /def
 
+
 # -------------------------------------------------------------------
 
 
+@u.quantity_input(
+    vels="speed", vesc="speed", vhold="speed", vcirc="speed", vmin="speed",
+)
 def calculate_Sx(
-    vels, vesc, vhold, vcirc, vmin, minsigma, sigma_factor, sig_unit=u.cm ** 2,
+    vels,
+    vesc,
+    vhold,
+    vcirc,
+    vmin,
+    minsigma,
+    sigma_factor,
+    sig_unit=u.cm ** 2,
+    dtype=np.float64,
 ):
     """Calculate Sx.
 
@@ -451,30 +1020,30 @@ def calculate_Sx(
     Other Parameters
     ----------------
     sig_unit : :class:`~astropy.units.Unit`
+    dtype : dtype, optional
+        The working precision of the integration, float32 or float64. The
+        results are always float64.
 
     Notes
     -----
-    This integration can be slow.
+    The integration is vectorized over the ``len(vels)**3`` velocity grid.
+    `vhold` is a running minimum, so it is computed with
+    :func:`numpy.minimum.accumulate` rather than a loop.
 
     """
-    Sxs = np.zeros(len(vels) ** 3) * sig_unit
-    iterator = itertools.product(vels, vels, vels)
+    dtype = _working_dtype(dtype)
 
-    for i, (vx, vy, vz) in tqdm(enumerate(iterator), total=len(Sxs)):
-        if qnorm(vx, vy, vz) <= vesc:
-            vrel = qnorm(vmin, vx, vy - vcirc, vz)
-            if vrel > vhold:
-                vrel = vhold
-            vhold = vrel  # update vhold   # problem? never reset vhold
+    # strip units, working in km / s
+    v, vesc, vhold, vcirc, vmin = _to_kms(vels, vesc, vhold, vcirc, vmin)
+    minsigma = _value(minsigma, sig_unit)
+    sigma_factor = _value(sigma_factor, sig_unit * _KMS ** 2)
 
-            sx = sigma_factor / vrel ** 2
-            if sx < minsigma:
-                sx = minsigma
-
-            Sxs[i] = sx
-    # /for
+    Sxs, vhold = _Sx_kernel(
+        v, vesc, vhold, vcirc, vmin, minsigma, sigma_factor, dtype
+    )
 
-    Sxs = Sxs[Sxs > 0]
+    Sxs = u.Quantity(Sxs, sig_unit, dtype=np.float64, copy=False)
+    vhold = u.Quantity(vhold, _KMS, dtype=np.float64)
 
     return Sxs, vhold
 
@@ -497,6 +1066,7 @@ def calculate_Mx_and_Sx(
     sigma_factor=None,
     m_unit=u.g,
     sig_unit=u.cm ** 2,
+    dtype=np.float64,
 ):
     """Calculate Mx and Sx.
 
@@ -526,33 +1096,37 @@ def calculate_Mx_and_Sx(
     minsigma : Quantity
     m_unit : :class:`~astropy.units.Unit`
     sig_unit : :class:`~astropy.units.Unit`
+    dtype : dtype, optional
+        The working precision, see :func:`calculate_Mx`.
 
     Notes
     -----
-    this is not a particularly efficient calculation method.
+    Mx and Sx are computed in one pass over the ``len(vels)**3`` velocity
+    grid, which is cheaper than calling :func:`calculate_Mx` and
+    :func:`calculate_Sx` in turn. As there, memory limits the size of
+    `vels`.
 
     """
-    Mxs, vbar, Vhold = calculate_Mx(
-        vels,
-        vvir=vvir,
-        vesc=vesc,
-        vcirc=vcirc,
-        vmin=vmin,
-        Arho=Arho,
-        m_unit=m_unit,
-    )
+    # The default Quantities are built once, when the module is imported,
+    # so calls using them pay no unit-construction cost.
+
+    dtype = _working_dtype(dtype)
 
-    Sxs, Vhold = calculate_Sx(
-        vels,
-        vesc=vesc,
-        vhold=Vhold,
-        vmin=vmin,
-        vcirc=vcirc,
-        minsigma=minsigma,
-        sig_unit=sig_unit,
-        sigma_factor=sigma_factor,
+    # strip units, working in km / s
+    v, vvir, vesc, vcirc, vmin = _to_kms(vels, vvir, vesc, vcirc, vmin)
+    Arho = _value(Arho, m_unit / _KMS)
+    minsigma = _value(minsigma, sig_unit)
+    sigma_factor = _value(sigma_factor, sig_unit * _KMS ** 2)
+
+    Mxs, Sxs, vbar, Vhold = _Mx_Sx_kernel(
+        v, vvir, vesc, vcirc, vmin, Arho, minsigma, sigma_factor, dtype
     )
 
+    Mxs = u.Quantity(Mxs, m_unit, dtype=np.float64, copy=False)
+    Sxs = u.Quantity(Sxs, sig_unit, dtype=np.float64, copy=False)
+    vbar = u.Quantity(vbar, _KMS, dtype=np.float64)
+    Vhold = u.Quantity(Vhold, _KMS, dtype=np.float64)
+
     return Mxs, Sxs, vbar, Vhold
 
 
@@ -37,11 +37,16 @@ __all__ = [
 # BUILT-IN
 
 from contextlib import contextmanager
+import importlib
 import typing as T
 
 # THIRD PARTY
 
 from matplotlib import pyplot
+from matplotlib.axes import Axes
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 
 import numpy as np
 
@@ -55,21 +60,140 @@ from . import data
 ##############################################################################
 # PARAMETERS
 
+# default masses [g] of the microlensing constraints, and their bounds
+_MMICRO = np.logspace(23.0, 28.0)
+_MMICRO_BOUNDS = (black_hole(_MMICRO), LMCTop(_MMICRO))
+
+for _arr in (_MMICRO, *_MMICRO_BOUNDS):
+    _arr.setflags(write=False)
+del _arr
+
+# marks axes set up by constraints_plot, as cleared axes lose it
+_MASS_LABEL = r"$M_{X}$ [g]"
 
 ##############################################################################
 # CODE
 ##############################################################################
 
+#####################################################################
+# Helpers
+
+
+def _as_float64(x: T.Sequence) -> np.ndarray:
+    """Convert to a contiguous float64 array, without copying if it is one.
+
+    Converting once at the top of a plot function spares the separate
+    conversions in the physics functions and in matplotlib.
+
+    """
+    return np.ascontiguousarray(x, dtype=np.float64)
+
+
+# /def
+
+
+def _fill_between(
+    ax: Axes,
+    x: T.Sequence,
+    y1: T.Sequence,
+    y2: T.Sequence,
+    collection: T.Optional[PolyCollection] = None,
+    **kwargs,
+):
+    """Fill between ``y1`` and ``y2``, like :meth:`~Axes.fill_between`.
+
+    The polygon is built directly, skipping the masking, ``where``,
+    ``step`` and ``interpolate`` handling, which the constraints do not need.
+    The data must be finite.
+
+    Parameters
+    ----------
+    ax : :class:`~matplotlib.axes.Axes`
+    x : Sequence
+        N x 1 array
+    y1, y2 : Sequence or float
+        broadcastable against `x`
+    collection : :class:`~matplotlib.collections.PolyCollection`, optional
+        a fill from a previous call, to update in place with
+        :meth:`~matplotlib.collections.PolyCollection.set_verts`.
+        `kwargs` are then ignored.
+    **kwargs
+        passed to :class:`~matplotlib.collections.PolyCollection`
+
+    Returns
+    -------
+    :class:`~matplotlib.collections.PolyCollection`
+
+    """
+    x, y1, y2 = np.broadcast_arrays(x, y1, y2)
+    N = len(x)
+
+    # the vertices in the same order as fill_between
+    pts = np.empty((2 * N + 2, 2))
+    pts[0] = x[0], y2[0]
+    pts[1 : N + 1, 0] = x
+    pts[1 : N + 1, 1] = y1
+    pts[N + 1] = x[-1], y2[-1]
+    pts[N + 2 :, 0] = x[::-1]
+    pts[N + 2 :, 1] = y2[::-1]
+
+    ax.update_datalim(pts)
+    if collection is not None:
+        collection.set_verts([pts])
+    else:
+        collection = PolyCollection([pts], **kwargs)
+        ax.add_collection(collection, autolim=False)
+    ax.autoscale_view()
+
+    return collection
+
+
+# /def
+
+
+def _add_polygon(ax: Axes, points: T.Sequence, **kwargs):
+    """Add a filled, black-edged constraint polygon to `ax`.
+
+    Parameters
+    ----------
+    ax : :class:`~matplotlib.axes.Axes`
+    points : Sequence
+        N x 2 array of vertices
+    **kwargs
+        the rest of the style, passed to :class:`~matplotlib.patches.Polygon`
+
+    Returns
+    -------
+    :class:`~matplotlib.patches.Polygon`
+
+    """
+    poly = pyplot.Polygon(
+        points, closed=None, fill=True, edgecolor="black", lw=1, **kwargs
+    )
+    ax.add_patch(poly)
+
+    return poly
+
+
+# /def
+
+
 #####################################################################
 # Reference Densities
 
 
-def plot_atomic_density_line(mass: T.Sequence, label=True):
+def plot_atomic_density_line(
+    mass: np.ndarray,
+    label=True,
+    xsec: T.Optional[T.Sequence] = None,
+    line: T.Optional[Line2D] = None,
+    ax: T.Optional[Axes] = None,
+):
     r"""Plot Atomic Density Line.
 
     Parameters
     ----------
-    mass : Sequence
+    mass : ndarray
         used in atomic_density(mass)
 
     Returns
@@ -80,6 +204,13 @@ def plot_atomic_density_line(mass: T.Sequence, label=True):
     ----------------
     label : bool
         Whether to add the label :math:`\rho_{atomic}`
+    xsec : Sequence, optional
+        precomputed ``atomic_density(mass)``, to avoid recomputing it.
+    line : :class:`~matplotlib.lines.Line2D`, optional
+        a line from a previous call, to update in place with
+        :meth:`~matplotlib.lines.Line2D.set_data` instead of drawing anew.
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     Notes
     -----
@@ -94,10 +225,21 @@ def plot_atomic_density_line(mass: T.Sequence, label=True):
     :func:`~macro_lightning.plot.plot_reference_densities`
 
     """
-    line = pyplot.loglog(
+    mass = _as_float64(mass)
+
+    if xsec is None:
+        xsec = atomic_density(mass)
+
+    if line is not None:
+        line.set_data(mass, xsec)
+        return line
+
+    if ax is None:
+        ax = pyplot.gca()
+
+    line = ax.loglog(
         mass,
-        atomic_density(mass),
-        "k",
+        xsec,
         markersize=4,
         color="k",
         lw=1,
@@ -113,12 +255,18 @@ def plot_atomic_density_line(mass: T.Sequence, label=True):
 # -------------------------------------------------------------------
 
 
-def plot_nuclear_density_line(mass: T.Sequence, label=True):
+def plot_nuclear_density_line(
+    mass: np.ndarray,
+    label=True,
+    xsec: T.Optional[T.Sequence] = None,
+    line: T.Optional[Line2D] = None,
+    ax: T.Optional[Axes] = None,
+):
     r"""Plot Nuclear Density Line.
 
     Parameters
     ----------
-    mass : Sequence
+    mass : ndarray
         used in atomic_density(mass)
 
     Returns
@@ -129,6 +277,12 @@ def plot_nuclear_density_line(mass: T.Sequence, label=True):
     ----------------
     label : bool
         whether to add the label :math:`\rho_{nuclear}`
+    xsec : Sequence, optional
+        precomputed ``nuclear_density(mass)``, to avoid recomputing it.
+    line : :class:`~matplotlib.lines.Line2D`, optional
+        a line to update in place, see `plot_atomic_density_line`.
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     Notes
     -----
@@ -143,9 +297,21 @@ def plot_nuclear_density_line(mass: T.Sequence, label=True):
     :func:`~macro_lightning.plot.plot_reference_densities`
 
     """
-    line = pyplot.loglog(
+    mass = _as_float64(mass)
+
+    if xsec is None:
+        xsec = nuclear_density(mass)
+
+    if line is not None:
+        line.set_data(mass, xsec)
+        return line
+
+    if ax is None:
+        ax = pyplot.gca()
+
+    line = ax.loglog(
         mass,
-        nuclear_density(mass),
+        xsec,
         markersize=4,
         color="g",
         lw=2,
@@ -161,13 +327,19 @@ def plot_nuclear_density_line(mass: T.Sequence, label=True):
 # -------------------------------------------------------------------
 
 
-def plot_black_hole_line(mass: T.Sequence, label=True):
+def plot_black_hole_line(
+    mass: np.ndarray,
+    label=True,
+    xsec: T.Optional[T.Sequence] = None,
+    line: T.Optional[Line2D] = None,
+    ax: T.Optional[Axes] = None,
+):
     r"""Plot Black Hole Density Line.
 
     Parameters
     ----------
-    mass : Sequence
-        used in atomic_density(mass)
+    mass : ndarray
+        used in black_hole(mass)
 
     Returns
     -------
@@ -177,6 +349,12 @@ def plot_black_hole_line(mass: T.Sequence, label=True):
     ----------------
     label : bool
         whether to add the label :math:`\rho_{BH}`
+    xsec : Sequence, optional
+        precomputed ``black_hole(mass)``, to avoid recomputing it.
+    line : :class:`~matplotlib.lines.Line2D`, optional
+        a line to update in place, see `plot_atomic_density_line`.
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     Notes
     -----
@@ -191,9 +369,21 @@ def plot_black_hole_line(mass: T.Sequence, label=True):
     :func:`~macro_lightning.plot.plot_reference_densities`
 
     """
-    line = pyplot.loglog(
+    mass = _as_float64(mass)
+
+    if xsec is None:
+        xsec = black_hole(mass)
+
+    if line is not None:
+        line.set_data(mass, xsec)
+        return line
+
+    if ax is None:
+        ax = pyplot.gca()
+
+    line = ax.loglog(
         mass,
-        black_hole(mass),
+        xsec,
         markersize=4,
         color="k",
         lw=3,
@@ -208,7 +398,13 @@ def plot_black_hole_line(mass: T.Sequence, label=True):
 # -------------------------------------------------------------------
 
 
-def plot_reference_densities(mass: T.Sequence, label=True):
+def plot_reference_densities(
+    mass: np.ndarray,
+    label=True,
+    bh_xsec: T.Optional[T.Sequence] = None,
+    lines: T.Optional[T.Tuple[Line2D, Line2D, Line2D]] = None,
+    ax: T.Optional[Axes] = None,
+):
     """Plot Reference Density lines / constraints.
 
     - atomic density line
@@ -217,7 +413,7 @@ def plot_reference_densities(mass: T.Sequence, label=True):
 
     Parameters
     ----------
-    mass : Sequence
+    mass : ndarray
         used in atomic_density(mass)
 
     Returns
@@ -233,6 +429,13 @@ def plot_reference_densities(mass: T.Sequence, label=True):
     ----------------
     label : bool
         whether to add the labels to the lines.
+    bh_xsec : Sequence, optional
+        precomputed ``black_hole(mass)``, see `plot_black_hole_line`.
+    lines : tuple of :class:`~matplotlib.lines.Line2D`, optional
+        the ``(atom_line, nuc_line, bh_line)`` from a previous call,
+        to update in place rather than drawing new lines.
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     See Also
     --------
@@ -241,9 +444,17 @@ def plot_reference_densities(mass: T.Sequence, label=True):
     :func:`~macro_lightning.plot.plot_black_hole_line`
 
     """
-    atom_line = plot_atomic_density_line(mass, label=label)
-    nuc_line = plot_nuclear_density_line(mass, label=label)
-    bh_line = plot_black_hole_line(mass, label=label)
+    mass = _as_float64(mass)
+
+    if lines is None:
+        lines = (None, None, None)
+    atom, nuc, bh = lines
+
+    atom_line = plot_atomic_density_line(mass, label=label, line=atom, ax=ax)
+    nuc_line = plot_nuclear_density_line(mass, label=label, line=nuc, ax=ax)
+    bh_line = plot_black_hole_line(
+        mass, label=label, xsec=bh_xsec, line=bh, ax=ax
+    )
 
     return atom_line, nuc_line, bh_line
 
@@ -254,7 +465,11 @@ def plot_reference_densities(mass: T.Sequence, label=True):
 #####################################################################
 
 
-def plot_mica_constraints(points: T.Optional[T.Sequence] = None, label=False):
+def plot_mica_constraints(
+    points: T.Optional[T.Sequence] = None,
+    label=False,
+    ax: T.Optional[Axes] = None,
+):
     r"""Plot Constraints from Mica.
 
     A longstanding constraint comes from examination of a slab of
@@ -278,6 +493,8 @@ def plot_mica_constraints(points: T.Optional[T.Sequence] = None, label=False):
     ----------------
     label : bool
         whether to add the label 'Mica'
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     Notes
     -----
@@ -306,19 +523,18 @@ def plot_mica_constraints(points: T.Optional[T.Sequence] = None, label=False):
     if points is None:
         points = data.load_mica_constraints()
 
-    mica_poly = pyplot.Polygon(
+    if ax is None:
+        ax = pyplot.gca()
+
+    mica_poly = _add_polygon(
+        ax,
         points,
-        closed=None,
-        fill=True,
         facecolor="yellow",
-        edgecolor="black",
         alpha=0.8,
         hatch="|",
-        lw=1,
         zorder=0,
         label="Mica" if label else None,
     )
-    pyplot.gca().add_patch(mica_poly)
 
     return mica_poly
 
@@ -330,7 +546,9 @@ def plot_mica_constraints(points: T.Optional[T.Sequence] = None, label=False):
 
 
 def plot_white_dwarf_constraints(
-    points: T.Optional[T.Sequence] = None, label=False
+    points: T.Optional[T.Sequence] = None,
+    label=False,
+    ax: T.Optional[Axes] = None,
 ):
     r"""Plot Constraints from the existence of massive White Dwarfs.
 
@@ -358,6 +576,8 @@ def plot_white_dwarf_constraints(
     ----------------
     label : bool
         whether to add the label 'WD'
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     Notes
     -----
@@ -383,19 +603,18 @@ def plot_white_dwarf_constraints(
     if points is None:
         points = data.load_whitedwarf_constraints()
 
-    wd_poly = pyplot.Polygon(
+    if ax is None:
+        ax = pyplot.gca()
+
+    wd_poly = _add_polygon(
+        ax,
         points,
-        closed=None,
-        fill=True,
         facecolor="blue",
-        edgecolor="black",
         alpha=0.6,
         hatch="",
-        lw=1,
         zorder=2,
         label="WD" if label else None,
     )
-    pyplot.gca().add_patch(wd_poly)
 
     return wd_poly
 
@@ -410,6 +629,7 @@ def plot_superbursts_constraints(
     points1: T.Optional[T.Sequence] = None,
     points2: T.Optional[T.Sequence] = None,
     label=False,
+    ax: T.Optional[Axes] = None,
 ):
     r"""Plot Constraints from Superbursts in Neutron Stars.
 
@@ -440,6 +660,8 @@ def plot_superbursts_constraints(
     ----------------
     label : bool
         whether to add the label 'superbursts(1/2)'
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     Notes
     -----
@@ -459,36 +681,32 @@ def plot_superbursts_constraints(
     :func:`~macro_lightning.plot.constraints_plot`
 
     """
-    _points1, _points2 = data.load_superbursts_polygons()
-    points1 = points1 or _points1
-    points2 = points2 or _points2
+    if points1 is None or points2 is None:  # only load if needed
+        _points1, _points2 = data.load_superbursts_polygons()
+        points1 = _points1 if points1 is None else points1
+        points2 = _points2 if points2 is None else points2
+
+    if ax is None:
+        ax = pyplot.gca()
 
-    superbursts1_poly = pyplot.Polygon(
+    superbursts1_poly = _add_polygon(
+        ax,
         points1,
-        closed=None,
-        fill=True,
         facecolor="purple",
-        edgecolor="black",
         alpha=0.6,
         hatch="",
-        lw=1,
         zorder=5,
         label="superbursts(1/2)" if label else None,
     )
-    pyplot.gca().add_patch(superbursts1_poly)
 
-    superbursts2_poly = pyplot.Polygon(
+    superbursts2_poly = _add_polygon(
+        ax,
         points2,
-        closed=None,
-        fill=True,
         facecolor="purple",
-        edgecolor="black",
         alpha=0.6,
         hatch="//",
-        lw=1,
         zorder=5,
     )
-    pyplot.gca().add_patch(superbursts2_poly)
 
     return superbursts1_poly, superbursts2_poly
 
@@ -499,7 +717,13 @@ def plot_superbursts_constraints(
 # -------------------------------------------------------------------
 
 
-def plot_cmb_constraints(m_arr: T.Sequence, sigmax: float, label=False):
+def plot_cmb_constraints(
+    m_arr: np.ndarray,
+    sigmax: float,
+    label=False,
+    fill: T.Optional[PolyCollection] = None,
+    ax: T.Optional[Axes] = None,
+):
     r"""Plot Constraints from the CMB.
 
     Wilkinson et al. [1] utilized the full Boltzmann formalism to
@@ -520,6 +744,12 @@ def plot_cmb_constraints(m_arr: T.Sequence, sigmax: float, label=False):
     ----------------
     label : bool
         whether to add the label 'CMB'
+    fill : :class:`~matplotlib.collections.PolyCollection`, optional
+        a fill from a previous call, to update in place with
+        :meth:`~matplotlib.collections.PolyCollection.set_verts`
+        instead of drawing anew.
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     Notes
     -----
@@ -539,11 +769,17 @@ def plot_cmb_constraints(m_arr: T.Sequence, sigmax: float, label=False):
     :func:`~macro_lightning.plot.constraints_plot`
 
     """
-    cmb_fill = pyplot.fill_between(
+    m_arr = _as_float64(m_arr)
+
+    if ax is None:
+        ax = pyplot.gca()
+
+    cmb_fill = _fill_between(
+        ax,
         m_arr,
         CMB(m_arr),
         sigmax,
-        where=None,
+        collection=fill,
         color="grey",
         edgecolor="black",
         hatch="",
@@ -566,6 +802,7 @@ def plot_humandeath_constraints(
     human_xsec: T.Optional[T.Sequence] = None,
     human_upper: T.Optional[T.Sequence] = None,
     label=False,
+    ax: T.Optional[Axes] = None,
 ):
     r"""Plot Constraints from dark matter caused human deaths.
 
@@ -602,6 +839,8 @@ def plot_humandeath_constraints(
     ----------------
     label : bool
         whether to add the label 'death'
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     References
     ----------
@@ -613,16 +852,20 @@ def plot_humandeath_constraints(
     :func:`~macro_lightning.plot.constraints_plot`
 
     """
-    _human_mass, _human_xsec, _human_upper = data.load_humandeath_constraints()
-    human_mass = human_mass or _human_mass
-    human_xsec = human_xsec or _human_xsec
-    human_upper = human_upper or _human_upper
+    if human_mass is None or human_xsec is None or human_upper is None:
+        _mass, _xsec, _upper = data.load_humandeath_constraints()
+        human_mass = _mass if human_mass is None else human_mass
+        human_xsec = _xsec if human_xsec is None else human_xsec
+        human_upper = _upper if human_upper is None else human_upper
+
+    if ax is None:
+        ax = pyplot.gca()
 
-    human_fill = pyplot.fill_between(
+    human_fill = _fill_between(
+        ax,
         human_mass,
         human_xsec,
         human_upper,
-        where=None,
         facecolor="red",
         edgecolor="black",
         hatch="",
@@ -645,6 +888,7 @@ def plot_dfn_constraints(
     dfn_xsec: T.Optional[T.Sequence] = None,
     dfn_upper: T.Optional[T.Sequence] = None,
     label=False,
+    ax: T.Optional[Axes] = None,
 ):
     r"""Plot Constraints from Desert Fireball Network (DFN).
 
@@ -675,6 +919,8 @@ def plot_dfn_constraints(
     ----------------
     label : bool
         whether to add the label 'DFN'
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     References
     ----------
@@ -686,16 +932,20 @@ def plot_dfn_constraints(
     :func:`~macro_lightning.plot.constraints_plot`
 
     """
-    _dfn_mass, _dfn_xsec, _dfn_upper = data.load_dfn_constraints()
-    dfn_mass = dfn_mass or _dfn_mass
-    dfn_xsec = dfn_xsec or _dfn_xsec
-    dfn_upper = dfn_upper or _dfn_upper
+    if dfn_mass is None or dfn_xsec is None or dfn_upper is None:
+        _mass, _xsec, _upper = data.load_dfn_constraints()
+        dfn_mass = _mass if dfn_mass is None else dfn_mass
+        dfn_xsec = _xsec if dfn_xsec is None else dfn_xsec
+        dfn_upper = _upper if dfn_upper is None else dfn_upper
 
-    dfn_fill = pyplot.fill_between(
+    if ax is None:
+        ax = pyplot.gca()
+
+    dfn_fill = _fill_between(
+        ax,
         dfn_mass,
         dfn_xsec,
         dfn_upper,
-        where=None,
         facecolor="green",
         edgecolor="black",
         hatch="",
@@ -714,7 +964,9 @@ def plot_dfn_constraints(
 
 
 def plot_lensing_constraints(
-    Mmicro: T.Optional[T.Sequence] = None, label=False
+    Mmicro: T.Optional[T.Sequence] = None,
+    label=False,
+    ax: T.Optional[Axes] = None,
 ):
     r"""Plot Constraints from microlensing of the LMC.
 
@@ -732,6 +984,8 @@ def plot_lensing_constraints(
     ----------------
     label : bool
         whether to add the label "$\mu$-lens"
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     References
     ----------
@@ -750,13 +1004,19 @@ def plot_lensing_constraints(
 
     """
     if Mmicro is None:
-        Mmicro = np.logspace(23.0, 28.0)
+        Mmicro = _MMICRO
+        lower, upper = _MMICRO_BOUNDS
+    else:
+        lower, upper = black_hole(Mmicro), LMCTop(Mmicro)
 
-    micro_fill = pyplot.fill_between(
+    if ax is None:
+        ax = pyplot.gca()
+
+    micro_fill = _fill_between(
+        ax,
         Mmicro,
-        black_hole(Mmicro),
-        LMCTop(Mmicro),
-        where=None,
+        lower,
+        upper,
         facecolor="brown",
         edgecolor="black",
         # hatch="/",
@@ -773,7 +1033,14 @@ def plot_lensing_constraints(
 # -------------------------------------------------------------------
 
 
-def plot_black_hole_constraints(m_arr: T.Sequence, sigmin: float, label=False):
+def plot_black_hole_constraints(
+    m_arr: np.ndarray,
+    sigmin: float,
+    label=False,
+    xsec: T.Optional[T.Sequence] = None,
+    fill: T.Optional[PolyCollection] = None,
+    ax: T.Optional[Axes] = None,
+):
     r"""Plot Constraints from Black Holes.
 
     Parameters
@@ -791,17 +1058,32 @@ def plot_black_hole_constraints(m_arr: T.Sequence, sigmin: float, label=False):
     ----------------
     label : bool
         whether to add the label "BH"
+    xsec : Sequence, optional
+        precomputed ``black_hole(m_arr)``, to avoid recomputing it.
+    fill : :class:`~matplotlib.collections.PolyCollection`, optional
+        a fill to update in place, see `plot_cmb_constraints`.
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes on which to plot. If None (default), the current axes.
 
     See Also
     --------
     :func:`~macro_lightning.plot.constraints_plot`
 
     """
-    bh_fill = pyplot.fill_between(
+    m_arr = _as_float64(m_arr)
+
+    if xsec is None:
+        xsec = black_hole(m_arr)
+
+    if ax is None:
+        ax = pyplot.gca()
+
+    bh_fill = _fill_between(
+        ax,
         m_arr,
         sigmin,
-        black_hole(m_arr),
-        where=None,
+        xsec,
+        collection=fill,
         color="black",
         hatch="+",
         zorder=2,
@@ -817,13 +1099,107 @@ def plot_black_hole_constraints(m_arr: T.Sequence, sigmin: float, label=False):
 #####################################################################
 
 
+def _as_tuple(artist) -> tuple:
+    """The artist(s) returned by a plot function, as a tuple."""
+    return artist if isinstance(artist, tuple) else (artist,)
+
+
+# /def
+
+
+def _pop_artist(cache: dict, name: str, label: bool, ax: Axes):
+    """Pop the artist(s) `name` from `cache`, to reuse on `ax`.
+
+    Parameters
+    ----------
+    cache : dict
+        name : (artist(s), label), from a previous call of
+        :func:`constraints_plot`
+    name : str
+    label : bool
+        whether the artist(s) are to be labeled.
+    ax : :class:`~matplotlib.axes.Axes`
+
+    Returns
+    -------
+    artist(s) or None
+        None if not in `cache`, drawn with another `label`, or no longer
+        on `ax`. Any such artists still on `ax` are removed.
+
+    """
+    artist, labeled = cache.pop(name, (None, None))
+    if artist is None:
+        return None
+
+    artists = _as_tuple(artist)
+    if labeled == label and all(a.axes is ax for a in artists):
+        return artist
+
+    for a in artists:
+        if a.axes is ax:
+            a.remove()
+    return None
+
+
+# /def
+
+
+def _make_redraw(fig: Figure, ax: Axes) -> T.Callable:
+    """Make a function that redraws only some artists on `ax`, by blitting.
+
+    On its first call the figure is drawn without the given artists and the
+    axes' background is cached. Each call then restores the background and
+    draws only the given artists on it.
+
+    Parameters
+    ----------
+    fig : :class:`~matplotlib.figure.Figure`
+        with a canvas that supports blitting, e.g. Agg-based.
+    ax : :class:`~matplotlib.axes.Axes`
+
+    Returns
+    -------
+    redraw : callable
+        with signature ``redraw(artists)``.
+
+    """
+    background = None
+
+    def redraw(artists: T.Sequence):
+        nonlocal background
+
+        for artist in artists:  # kept out of full draws, and the background
+            artist.set_animated(True)
+
+        if background is None:
+            fig.canvas.draw()
+            background = fig.canvas.copy_from_bbox(ax.bbox)
+        else:
+            fig.canvas.restore_region(background)
+
+        for artist in artists:
+            ax.draw_artist(artist)
+        fig.canvas.blit(ax.bbox)
+
+    return redraw
+
+
+# /def
+
+# -------------------------------------------------------------------
+
+
 @contextmanager
 def constraints_plot(
     m_arr: T.Sequence,
     sigmin: float = 1e-15,
     sigmax: float = 1e25,
     *,
+    ax: T.Optional[Axes] = None,
+    backend: T.Optional[str] = None,
     savefig: T.Optional[str] = None,
+    blit: bool = False,
+    reference: bool = True,
     constr_labels: bool = False,
     all_constrs: bool = False,
     # individual constraints
@@ -843,11 +1219,35 @@ def constraints_plot(
     Parameters
     ----------
     m_arr : Sequence
-        mass array
+        mass array (e.g. from :func:`~numpy.logspace`).
+        Converted once to a contiguous float64 array, which is passed
+        on to the plot functions.
     sigmin : float
         minimum plotted sigma
     sigmax : float
         maximum plotted sigma
+    ax : :class:`~matplotlib.axes.Axes`, optional
+        axes to reuse, e.g. when re-plotting in a notebook or animating a
+        sweep. If None (default), a new figure is made.
+        Only the artists of the previous call on `ax` are replaced: those
+        depending on `m_arr`, `sigmin` or `sigmax` are updated in place,
+        the fixed constraints are kept, and the rest are removed. They are
+        listed in ``ax.macro_constraints``. Other artists are kept, as are
+        the labels and grid, which are set up only once per axes.
+    backend : str, optional
+        the name of a matplotlib backend, e.g. "agg", with which to make the
+        new figure directly. The figure is then not managed by
+        :mod:`~matplotlib.pyplot`: this skips the figure manager and
+        need not be closed, which suits batch rendering. Does not change the
+        global backend. If None (default), uses
+        :func:`~matplotlib.pyplot.subplots`. Ignored if `ax` is given.
+    blit : bool
+        whether to also yield a ``redraw(artists)`` function, which redraws
+        only `artists` over the cached constraints, e.g. when animating
+        a custom constraint in the context (default False).
+    reference : bool
+        whether to plot the reference densities (default True).
+        See :func:`~macro_lightning.plot.plot_reference_densities`
     constr_labels : bool
         whether to add labels to all the `Other Parameters`
 
@@ -855,12 +1255,15 @@ def constraints_plot(
     ------
     fig : :class:`~matplotlib.Figure`
     ax : :class:`~matplotlib.Axes`
-    m_arr : Sequence
-        mass array
+    m_arr : ndarray
+        mass array, as converted
     sigmin : float
         minimum plotted sigma
     sigmax : float
         maximum plotted sigma
+    redraw : callable
+        only if `blit`. ``redraw(artists)`` restores the plot as first
+        drawn, without `artists`, then draws and blits only `artists`.
 
     Other Parameters
     ----------------
@@ -918,6 +1321,11 @@ def constraints_plot(
         >>> with constraints_plot(M, sigmin=1e-15):
         ...     pass
 
+    Skipping the reference densities, e.g. in a parameter sweep where only
+    the custom constraints matter.
+        >>> with constraints_plot(M, reference=False):
+        ...     pass
+
     References
     ----------
     .. [1] Price, P. (1988). Limits on Contribution of Cosmic Nuclearites
@@ -943,47 +1351,132 @@ def constraints_plot(
     .. [12] H. Niikura et al., Nature Astronomy 3, 524 (2019)
 
     """
-    fig, ax = pyplot.subplots(figsize=(8, 5.5))
-    ax.grid(True, alpha=0.7)
+    m_arr = _as_float64(m_arr)
+
+    if ax is not None:  # reuse, skipping the figure and canvas construction
+        fig = ax.figure
+        # for pyplot calls in the context, if pyplot manages the figure
+        if getattr(fig, "number", None) in pyplot.get_fignums():
+            pyplot.sca(ax)
+    elif backend is None:
+        fig, ax = pyplot.subplots(figsize=(8, 5.5))
+    else:  # without pyplot
+        module = importlib.import_module(
+            "matplotlib.backends.backend_" + backend.lower()
+        )
+        fig = Figure(figsize=(8, 5.5))
+        module.FigureCanvas(fig)
+        ax = fig.add_subplot()
 
-    ax.set_xlabel(r"$M_{X}$ [g]", fontsize=18)
     ax.set_xlim([m_arr.min(), m_arr.max()])
-    for tick in ax.xaxis.get_major_ticks():
-        tick.label.set_fontsize(14)
-
     ax.set_ylim(sigmin, sigmax)  # min/max of nuclear_density(M1)
-    ax.set_ylabel(r"$\sigma_{X}$ [cm$^{2}$]", fontsize=18)
-    for tick in ax.yaxis.get_major_ticks():
-        tick.label.set_fontsize(14)
 
-    plot_reference_densities(m_arr)
+    # the static setup, skipped on axes already set up
+    initialized = getattr(ax, "_macro_initialized", False)
+    if not (initialized and ax.get_xlabel() == _MASS_LABEL):
+        ax.grid(True, alpha=0.7)
+
+        ax.set_xlabel(_MASS_LABEL, fontsize=18)
+        for tick in ax.xaxis.get_major_ticks():
+            tick.label.set_fontsize(14)
+
+        ax.set_ylabel(r"$\sigma_{X}$ [cm$^{2}$]", fontsize=18)
+        for tick in ax.yaxis.get_major_ticks():
+            tick.label.set_fontsize(14)
+
+        ax._macro_initialized = True
+
+    # the artists of the previous call on `ax`, to reuse
+    previous = getattr(ax, "_macro_constraint_artists", {})
+    artists = {}  # name : (artist(s), label)
+
+    def draw(name, plotter, *args, update=None, label=constr_labels, **kw):
+        """Draw the artist(s) `name`, reusing those of the previous call.
+
+        Those depending on the arguments are passed to `plotter` as the
+        keyword `update`, to update in place. The others are kept as is.
+
+        """
+        artist = _pop_artist(previous, name, label, ax)
+        if update is not None:
+            kw[update] = artist
+            artist = plotter(*args, label=label, ax=ax, **kw)
+        elif artist is None:
+            artist = plotter(*args, label=label, ax=ax, **kw)
+        artists[name] = (artist, label)
+
+    # shared by the reference line and the constraint
+    if reference or bh_constr or all_constrs:
+        bh_xsec = black_hole(m_arr)
+
+    if reference:
+        draw(
+            "reference",
+            plot_reference_densities,
+            m_arr,
+            bh_xsec=bh_xsec,
+            update="lines",
+            label=True,
+        )
 
     # previous constraints
 
     if mica_constr or all_constrs:
-        plot_mica_constraints(label=constr_labels)
+        draw("mica", plot_mica_constraints)
     if WD_constr or all_constrs:
-        plot_white_dwarf_constraints(label=constr_labels)
+        draw("WD", plot_white_dwarf_constraints)
     if CMB_constr or all_constrs:
-        plot_cmb_constraints(m_arr, sigmax=sigmax, label=constr_labels)
+        draw("CMB", plot_cmb_constraints, m_arr, sigmax=sigmax, update="fill")
     if superbursts_constr or all_constrs:
-        plot_superbursts_constraints(label=constr_labels)
+        draw("superbursts", plot_superbursts_constraints)
     if humandeath_constr or all_constrs:
-        plot_humandeath_constraints(label=constr_labels)
+        draw("humandeath", plot_humandeath_constraints)
     if dfn_constr or all_constrs:
-        plot_dfn_constraints(label=constr_labels)
+        draw("dfn", plot_dfn_constraints)
     if lensing_constr or all_constrs:
-        plot_lensing_constraints(Mmicro=None, label=constr_labels)
+        draw("lensing", plot_lensing_constraints, Mmicro=None)
     if bh_constr or all_constrs:
-        plot_black_hole_constraints(m_arr, sigmin=sigmin, label=constr_labels)
+        draw(
+            "BH",
+            plot_black_hole_constraints,
+            m_arr,
+            sigmin=sigmin,
+            xsec=bh_xsec,
+            update="fill",
+        )
+
+    # remove the artists no longer plotted
+    for artist, _ in previous.values():
+        for a in _as_tuple(artist):
+            if a.axes is ax:
+                a.remove()
+
+    ax._macro_constraint_artists = artists
+    ax.macro_constraints = [
+        a for artist, _ in artists.values() for a in _as_tuple(artist)
+    ]
 
     try:
-        yield fig, ax, m_arr, sigmin, sigmax
+        if blit:
+            yield fig, ax, m_arr, sigmin, sigmax, _make_redraw(fig, ax)
+        else:
+            yield fig, ax, m_arr, sigmin, sigmax
 
     finally:
 
-        ax.legend(loc="upper left", shadow=True, fontsize=12, ncol=2)
-        pyplot.tight_layout()
+        handles, labels = ax.get_legend_handles_labels()
+        if labels:  # skip building an empty legend
+            ax.legend(
+                handles,
+                labels,
+                loc="upper left",
+                shadow=True,
+                fontsize=12,
+                ncol=2,
+            )
+        elif ax.get_legend() is not None:  # of a previous call
+            ax.get_legend().remove()
+        fig.tight_layout()
 
         if savefig is not None:
             fig.savefig(savefig)
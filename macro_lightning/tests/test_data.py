@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""Test :mod:`~macro_lightning.data`."""
+
+
+__all__ = [
+    "test_polygons_match_text",
+    "test_constraints_match_text",
+    "test_no_table_import",
+]
+
+
+##############################################################################
+# IMPORTS
+
+# BUILT-IN
+
+import subprocess
+import sys
+
+
+# THIRD PARTY
+
+import numpy as np
+
+import pytest
+
+
+# PROJECT-SPECIFIC
+
+from .. import data
+
+
+##############################################################################
+# PARAMETERS
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+@pytest.mark.parametrize(
+    "name, kwargs",
+    [
+        ("mica_polygon", dict(delimiter=",", skiprows=1)),
+        ("superbursts1_polygon", {}),
+        ("superbursts2_polygon", {}),
+        ("whitedwarf_polygon", {}),
+    ],
+)
+def test_polygons_match_text(name, kwargs):
+    """Test the ``.npy`` polygons are built from the current ``.txt``.
+
+    If this fails, re-run ``scripts/build_data.py``.
+
+    """
+    text = data._read_text_array(
+        data._data_dir.joinpath(name + ".txt"), **kwargs
+    )
+    binary = np.load(data._data_dir.joinpath(name + ".npy"))
+
+    assert np.array_equal(binary, text)
+    assert binary.flags.c_contiguous
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["humandeath_constraints", "dfn_constraints", "dfn_future_constraints"],
+)
+def test_constraints_match_text(name):
+    """Test the ``.npz`` constraints are built from the current ``.ecsv``.
+
+    If this fails, re-run ``scripts/build_data.py``.
+
+    """
+    text = data._ecsv_columns(
+        data._data_dir.joinpath(name + ".ecsv"),
+        ("mass", "cross-section", "upper-lim"),
+    )
+    with np.load(data._data_dir.joinpath(name + ".npz")) as binary:
+        for key, column in zip(("mass", "xsec", "upper"), text):
+            assert np.array_equal(binary[key], column)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_no_table_import():
+    """Test importing :mod:`~macro_lightning.data` skips `astropy.table`.
+
+    Run in a fresh interpreter, since the test session may already have
+    imported :mod:`astropy.table`.
+
+    """
+    code = (
+        "import sys, macro_lightning.data; "
+        "assert 'astropy.table' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+# /def
+
+
+##############################################################################
+# END
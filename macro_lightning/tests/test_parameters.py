@@ -6,6 +6,7 @@
 __all__ = [
     "test_solar_system_vesc_params",
     "test_vesc_sun_at_R",
+    "test_vesc_sun_at_R_bad_input",
 ]
 
 
@@ -65,6 +66,31 @@ def test_solar_system_vesc_params():
     new_ss = params.solar_system_vesc_params.get()
     assert new_ss == new_params
 
+    # test names are case-insensitive, including after registering
+    params.solar_system_vesc_params.set("Default")
+    assert params.solar_system_vesc_params.get() == expected
+
+    params.solar_system_vesc_params.set("NEW")
+    assert params.solar_system_vesc_params.get() == new_params
+
+    # test unknown names
+    with pytest.raises(ValueError):
+        params.solar_system_vesc_params.set("not registered")
+
+    # test names differing only in case do not shadow each other
+    with pytest.raises(ValueError, match="only in case"):
+        params.solar_system_vesc_params.register(
+            "default", params=new_params, references={}
+        )
+    assert "default" not in params.solar_system_vesc_params._registry
+    params.solar_system_vesc_params.set("DEFAULT")
+    assert params.solar_system_vesc_params.get() == expected
+
+    # but re-registering the same name replaces it
+    params.solar_system_vesc_params.register("new", params=ss, references={})
+    params.solar_system_vesc_params.set("new")
+    assert params.solar_system_vesc_params.get() == ss
+
     pass
 
 
@@ -82,12 +108,18 @@ def test_vesc_sun_at_R():
     # quadruple distance = half the escape velocity
     assert params.vesc_sun_at_R(4 * u.AU) == 2.0 * params.vesc_sun_at_earth
 
-    # Error test
-    with pytest.raises(Exception):
-        params.vesc_sun_at_R(1)
 
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("R", [1, 1 * u.deg])
+def test_vesc_sun_at_R_bad_input(R):
+    """Test :func:`~macro_lightning.parameters.vesc_sun_at_R` errors."""
     with pytest.raises(Exception):
-        params.vesc_sun_at_R(1 * u.deg)
+        params.vesc_sun_at_R(R)
 
 
 # /def
@@ -0,0 +1,528 @@
+# -*- coding: utf-8 -*-
+
+"""Test :mod:`~macro_lightning.physics`."""
+
+
+__all__ = [
+    "test_nuclear_density",
+    "test_atomic_density",
+    "test_black_hole",
+    "test_density_out",
+    "test_f_BM_bin",
+    "test_twobody_vesc",
+    "test_multibody_vesc",
+    "test_multibody_vesc_array",
+    "test_multibody_vesc_cached",
+    "test_calculate_Mx",
+    "test_calculate_Mx_uneven",
+    "test_calculate_Sx",
+    "test_calculate_Mx_and_Sx",
+    "test_calculate_Mx_and_Sx_blocked",
+    "test_calculate_Mx_and_Sx_cached_grid",
+    "test_calculate_Mx_and_Sx_float32",
+    "test_calculate_bad_dtype",
+]
+
+
+##############################################################################
+# IMPORTS
+
+# BUILT-IN
+
+import itertools
+
+
+# THIRD PARTY
+
+import astropy.units as u
+
+import numpy as np
+
+import pytest
+
+
+# PROJECT-SPECIFIC
+
+from .. import physics
+
+
+##############################################################################
+# PARAMETERS
+
+_KMS = u.km / u.s
+
+_VELS = np.linspace(-600, 600, 9) * _KMS
+_VVIR = 250 * _KMS
+_VESC = 550 * _KMS
+_VCIRC = 220 * _KMS
+_VMIN = 42.1 * _KMS
+_ARHO = 3 * u.g * u.s / u.m
+_MINSIGMA = 6e-8 * u.cm ** 2
+_SIGMA_FACTOR = 3e-2 * u.cm ** 2 * _KMS ** 2
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+@pytest.mark.parametrize("M", [1e10, np.geomspace(1, 1e200, 50)])
+def test_nuclear_density(M):
+    """Test :func:`~macro_lightning.physics.nuclear_density`."""
+    expected = np.pi * np.power(M / (4.0 / 3.0 * np.pi * 3.6e14), 2.0 / 3)
+
+    assert np.allclose(physics.nuclear_density(M), expected, rtol=1e-13)
+
+    out = np.empty_like(M)
+    got = physics.nuclear_density(M, out=out)
+    if np.ndim(M):
+        assert got is out
+    assert np.allclose(got, expected, rtol=1e-13)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("M", [1e10, np.geomspace(1, 1e200, 50)])
+def test_atomic_density(M):
+    """Test :func:`~macro_lightning.physics.atomic_density`."""
+    expected = np.pi * np.power(M / (4.0 / 3.0 * np.pi), 2.0 / 3)
+
+    assert np.allclose(physics.atomic_density(M), expected, rtol=1e-13)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "M", [1e33, np.geomspace(1, 1e30, 50), np.array([10 ** 12, 10 ** 15])]
+)
+def test_black_hole(M):
+    """Test :func:`~macro_lightning.physics.black_hole`.
+
+    Integer masses must not overflow when squared.
+
+    """
+    M_float = np.asarray(M, dtype=float)
+    expected = np.pi * (3e5) ** 2 * (M_float / 2e33) ** 2
+
+    assert np.allclose(physics.black_hole(M), expected, rtol=1e-14)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        physics.CMB,
+        physics.nuclear_density,
+        physics.black_hole,
+        physics.atomic_density,
+        physics.KeplerTop,
+        physics.LMCTop,
+    ],
+)
+def test_density_out(func):
+    """Test the density and bound functions compute within `out`."""
+    M = np.geomspace(1, 1e25, 50)
+    expected = func(M)
+
+    out = np.empty_like(M)
+    got = func(M, out=out)
+
+    assert got is out
+    assert np.array_equal(got, expected)
+
+    # scalars need no buffer
+    assert np.isclose(func(M[10]), expected[10], rtol=1e-15, atol=0)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_f_BM_bin():
+    """Test :func:`~macro_lightning.physics.f_BM_bin`."""
+    vx = np.array([0.0, 100.0, 300.0])
+    got = physics.f_BM_bin(vx * _KMS, 10 * _KMS, _VVIR)
+
+    norm = (10.0 / 250.0) ** 3 / np.pi ** 1.5
+    expected = norm * np.exp(-((vx / 250.0) ** 2))
+
+    assert got.unit.physical_type == "dimensionless"
+    assert np.allclose(got.to_value(u.one), expected, rtol=1e-14, atol=0)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_twobody_vesc():
+    """Test :func:`~macro_lightning.physics.twobody_vesc`."""
+    ve1, ve2 = 11.186 * _KMS, 42.1 * _KMS
+
+    # None -> circular orbit
+    expected = np.hypot(11.186, 42.1 * (1 - 1 / np.sqrt(2)))
+    got = physics.twobody_vesc(ve1, ve2)
+    assert np.isclose(got.to_value(_KMS), expected, rtol=1e-14)
+
+    # a zero orbital velocity is not the default
+    got = physics.twobody_vesc(ve1, ve2, vo=0 * _KMS)
+    assert np.isclose(got.to_value(_KMS), np.hypot(11.186, 42.1), rtol=1e-14)
+
+    # nor is an array
+    vo = [0, 10] * _KMS
+    got = physics.twobody_vesc(ve1, ve2, vo=vo)
+    expected = np.hypot(11.186, 42.1 - np.array([0, 10]))
+    assert np.allclose(got.to_value(_KMS), expected, rtol=1e-14)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_multibody_vesc():
+    """Test :func:`~macro_lightning.physics.multibody_vesc`."""
+    vescs = (11.186 * _KMS, 42.1 * _KMS, 550 * _KMS)
+
+    # pairwise, as twobody_vesc would chain them
+    k = 1 - 1 / np.sqrt(2)
+    expected = [11.186]
+    for ve in (42.1, 550):
+        expected.append(np.hypot(expected[-1], ve * k))
+
+    total = physics.multibody_vesc(*vescs)
+    accumulated = physics.multibody_vesc(*vescs, accumulate=True)
+
+    assert np.isclose(total.to_value(_KMS), expected[-1], rtol=1e-14)
+    assert np.allclose(accumulated.to_value(_KMS), expected, rtol=1e-14)
+
+    # and with explicit orbital velocities
+    vo = [30, 220] * _KMS
+    total = physics.multibody_vesc(*vescs, vo=vo)
+    assert np.isclose(
+        total.to_value(_KMS),
+        np.sqrt(11.186 ** 2 + (42.1 - 30) ** 2 + (550 - 220) ** 2),
+        rtol=1e-14,
+    )
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_multibody_vesc_array():
+    """Test :func:`~macro_lightning.physics.multibody_vesc` element-wise."""
+    vearth = [11, 12] * _KMS
+    vsun = [42, 43] * _KMS
+
+    k = 1 - 1 / np.sqrt(2)
+    expected = np.sqrt(vearth ** 2 + (vsun * k) ** 2)
+
+    total = physics.multibody_vesc(vearth, vsun)
+    assert total.shape == (2,)
+    assert u.allclose(total, expected, rtol=1e-14)
+
+    accumulated = physics.multibody_vesc(vearth, vsun, accumulate=True)
+    assert accumulated.shape == (2, 2)
+    assert u.allclose(accumulated[0], vearth, rtol=1e-14)
+    assert u.allclose(accumulated[1], expected, rtol=1e-14)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_multibody_vesc_cached():
+    """Test scalar :func:`~macro_lightning.physics.multibody_vesc` is cached.
+
+    The cached result keeps the unit of the first velocity.
+
+    """
+    physics._multibody_vesc_scalar.cache_clear()
+
+    first = physics.multibody_vesc(11186 * u.m / u.s, 42.1 * _KMS)
+    second = physics.multibody_vesc(11186 * u.m / u.s, 42.1 * _KMS)
+
+    assert physics._multibody_vesc_scalar.cache_info().hits == 1
+    assert first.unit == u.m / u.s
+    assert first == second
+
+    # arrays bypass the cache
+    arr = physics.multibody_vesc([11.186, 11.186] * _KMS, [42.1, 42.1] * _KMS)
+    assert physics._multibody_vesc_scalar.cache_info().currsize == 1
+    assert u.allclose(arr, [first, first], rtol=1e-14)
+
+    # plain floats are dimensionless, as with as_quantity
+    plain = physics.multibody_vesc(11.186, 42.1)
+    assert plain.unit == u.one
+    assert np.isclose(plain.value, first.to_value(_KMS), rtol=1e-14)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _loop_Mx(vels, vvir, vesc, vcirc, vmin, Arho):
+    """Calculate Mx one velocity at a time, as a reference."""
+    v = vels.to_value(_KMS)
+    vvir, vesc, vcirc, vmin = (
+        x.to_value(_KMS) for x in (vvir, vesc, vcirc, vmin)
+    )
+    vstep = v[1] - v[0]
+
+    vbar, vbars, vhold = 0.0, [], None
+    for vx, vy, vz in itertools.product(v, v, v):
+        speed = np.sqrt(vx ** 2 + vy ** 2 + vz ** 2)
+        if speed <= vesc:
+            maxwellian = (vstep / vvir) ** 3 / np.pi ** 1.5
+            maxwellian *= np.exp(-((speed / vvir) ** 2))
+            vhold = np.sqrt(vmin ** 2 + vx ** 2 + (vy - vcirc) ** 2 + vz ** 2)
+            vbar += vhold * maxwellian
+            vbars.append(vbar)
+
+    Mxs = Arho.to_value(u.g / _KMS) * np.array(vbars)
+    return Mxs, vbar, vhold
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_calculate_Mx():
+    """Test :func:`~macro_lightning.physics.calculate_Mx`."""
+    Mxs, vbar, Vhold = physics.calculate_Mx(
+        _VELS, _VVIR, _VESC, _VCIRC, _VMIN, _ARHO
+    )
+    expected = _loop_Mx(_VELS, _VVIR, _VESC, _VCIRC, _VMIN, _ARHO)
+
+    assert Mxs.unit == u.g
+    assert vbar.unit == _KMS and Vhold.unit == _KMS
+    assert np.allclose(Mxs.value, expected[0], rtol=1e-12, atol=0)
+    assert np.isclose(vbar.value, expected[1], rtol=1e-12, atol=0)
+    assert np.isclose(Vhold.value, expected[2], rtol=1e-12, atol=0)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_calculate_Mx_uneven():
+    """Test :func:`~macro_lightning.physics.calculate_Mx` needs even steps."""
+    vels = np.geomspace(1, 600, 9) * _KMS
+
+    with pytest.raises(ValueError, match="unequal"):
+        physics.calculate_Mx(vels, _VVIR, _VESC, _VCIRC, _VMIN, _ARHO)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def _loop_Sx(vels, vesc, vhold, vcirc, vmin, minsigma, sigma_factor):
+    """Calculate Sx one velocity at a time, as a reference."""
+    v = vels.to_value(_KMS)
+    vesc, vhold, vcirc, vmin = (
+        x.to_value(_KMS) for x in (vesc, vhold, vcirc, vmin)
+    )
+    minsigma = minsigma.to_value(u.cm ** 2)
+    sigma_factor = sigma_factor.to_value(u.cm ** 2 * _KMS ** 2)
+
+    Sxs = []
+    for vx, vy, vz in itertools.product(v, v, v):
+        if np.sqrt(vx ** 2 + vy ** 2 + vz ** 2) <= vesc:
+            vrel = np.sqrt(vmin ** 2 + vx ** 2 + (vy - vcirc) ** 2 + vz ** 2)
+            vhold = min(vrel, vhold)
+            Sxs.append(max(sigma_factor / vhold ** 2, minsigma))
+
+    return np.array(Sxs), vhold
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_calculate_Sx():
+    """Test :func:`~macro_lightning.physics.calculate_Sx`."""
+    _, _, vhold = physics.calculate_Mx(
+        _VELS, _VVIR, _VESC, _VCIRC, _VMIN, _ARHO
+    )
+    args = (_VELS, _VESC, vhold, _VCIRC, _VMIN, _MINSIGMA, _SIGMA_FACTOR)
+
+    Sxs, vhold = physics.calculate_Sx(*args)
+    expected = _loop_Sx(*args)
+
+    assert Sxs.unit == u.cm ** 2
+    assert vhold.unit == _KMS
+    assert np.allclose(Sxs.value, expected[0], rtol=1e-12, atol=0)
+    assert np.isclose(vhold.value, expected[1], rtol=1e-12, atol=0)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_calculate_Mx_and_Sx():
+    """Test :func:`~macro_lightning.physics.calculate_Mx_and_Sx`."""
+    Mxs, Sxs, vbar, vhold = physics.calculate_Mx_and_Sx(
+        _VELS,
+        _VVIR,
+        _VESC,
+        _VCIRC,
+        _VMIN,
+        _ARHO,
+        minsigma=_MINSIGMA,
+        sigma_factor=_SIGMA_FACTOR,
+    )
+
+    # the fused pass matches Mx followed by Sx
+    expected_Mxs, expected_vbar, Vhold = physics.calculate_Mx(
+        _VELS, _VVIR, _VESC, _VCIRC, _VMIN, _ARHO
+    )
+    expected_Sxs, expected_vhold = physics.calculate_Sx(
+        _VELS, _VESC, Vhold, _VCIRC, _VMIN, _MINSIGMA, _SIGMA_FACTOR
+    )
+
+    assert np.array_equal(Mxs, expected_Mxs)
+    assert np.array_equal(Sxs, expected_Sxs)
+    assert vbar == expected_vbar
+    assert vhold == expected_vhold
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("cpus", [1, 4])
+def test_calculate_Mx_and_Sx_blocked(monkeypatch, cpus):
+    """Test the velocity grid gives the same result in blocks."""
+    kw = dict(minsigma=_MINSIGMA, sigma_factor=_SIGMA_FACTOR)
+    args = (_VELS, _VVIR, _VESC, _VCIRC, _VMIN, _ARHO)
+    expected = physics.calculate_Mx_and_Sx(*args, **kw)
+
+    # 2 rows of the grid per block
+    monkeypatch.setattr(physics, "_BLOCK_SIZE", 2 * len(_VELS) ** 2)
+    monkeypatch.setattr(physics.os, "cpu_count", lambda: cpus)
+    physics.clear_velocity_grid_cache()
+    got = physics.calculate_Mx_and_Sx(*args, **kw)
+
+    for g, e in zip(got, expected):
+        assert np.array_equal(g, e)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_calculate_Mx_and_Sx_cached_grid():
+    """Test the velocity grid is reused across parameter sweeps."""
+    physics.clear_velocity_grid_cache()
+    kw = dict(minsigma=_MINSIGMA, sigma_factor=_SIGMA_FACTOR)
+
+    results = [
+        physics.calculate_Mx_and_Sx(
+            _VELS, vvir, _VESC, _VCIRC, _VMIN, _ARHO, **kw
+        )
+        for vvir in (200 * _KMS, 250 * _KMS)
+    ]
+
+    info = physics._bound_velocities_from_bytes.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert not np.array_equal(results[0][0], results[1][0])
+
+    # the cached grid is not modified by the integrals
+    vx, *_ = physics._cached_bound_velocities(_VELS.to_value(_KMS), 550)
+    assert not vx.flags.writeable
+
+    # only the last grid is kept, and it can be freed
+    physics._cached_bound_velocities(_VELS.to_value(_KMS)[:-1], 550)
+    assert physics._bound_velocities_from_bytes.cache_info().currsize == 1
+    physics.clear_velocity_grid_cache()
+    assert physics._bound_velocities_from_bytes.cache_info().currsize == 0
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_calculate_Mx_and_Sx_float32():
+    """Test the single precision integration."""
+    kw = dict(minsigma=_MINSIGMA, sigma_factor=_SIGMA_FACTOR)
+    args = (_VELS, _VVIR, _VESC, _VCIRC, _VMIN, _ARHO)
+
+    expected = physics.calculate_Mx_and_Sx(*args, **kw)
+    got = physics.calculate_Mx_and_Sx(*args, dtype=np.float32, **kw)
+
+    for g, e in zip(got, expected):
+        assert g.dtype == np.float64
+        assert g.unit == e.unit
+        assert np.allclose(g.value, e.value, rtol=1e-5, atol=0)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.int64, complex])
+def test_calculate_bad_dtype(dtype):
+    """Test the integrations only run in float32 or float64."""
+    vhold = 550 * _KMS
+    calls = (
+        (physics.calculate_Mx, (_VVIR, _VESC, _VCIRC, _VMIN, _ARHO)),
+        (
+            physics.calculate_Sx,
+            (_VESC, vhold, _VCIRC, _VMIN, _MINSIGMA, _SIGMA_FACTOR),
+        ),
+        (physics.calculate_Mx_and_Sx, (_VVIR, _VESC, _VCIRC, _VMIN, _ARHO)),
+    )
+
+    for func, args in calls:
+        with pytest.raises(ValueError, match="float32 or float64"):
+            func(_VELS, *args, dtype=dtype)
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -4,20 +4,33 @@
 
 
 __all__ = [
+    "test_fill_between",
     "test_plot_atomic_density_line",
     "test_plot_nuclear_density_line",
     "test_plot_black_hole_line",
     "test_plot_reference_densities",
+    "test_update_reference_densities",
     "test_plot_mica_constraints",
     "test_plot_white_dwarf_constraints",
     "test_plot_cmb_constraints",
     "test_plot_superbursts_constraints",
     "test_plot_humandeath_constraints",
     "test_plot_dfn_constraints",
+    "test_plot_constraints_given_data",
     "test_plot_lensing_constraints",
+    "test_lensing_default_masses",
     "test_plot_black_hole_constraints",
     "test_empty_constraints_plot",
     "test_full_constraints_plot",
+    "test_reused_constraints_plot",
+    "test_constraints_plot_no_reference",
+    "test_plot_on_given_axes",
+    "test_constraints_plot_backend",
+    "test_constraints_plot_unmanaged_axes",
+    "test_constraints_plot_xlim",
+    "test_constraints_plot_reuse_artists",
+    "test_constraints_plot_update_in_place",
+    "test_constraints_plot_blit",
 ]
 
 
@@ -61,6 +74,28 @@ Mmicro = np.logspace(23.0, 28.0)
 ##############################################################################
 
 
+def test_fill_between():
+    """Test ``_fill_between`` matches :meth:`~Axes.fill_between`."""
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+
+    expected = ax1.fill_between(m_arr, sigmin, np.sqrt(m_arr))
+    got = plot._fill_between(ax2, m_arr, sigmin, np.sqrt(m_arr))
+
+    assert np.array_equal(
+        got.get_paths()[0].vertices, expected.get_paths()[0].vertices
+    )
+    assert np.array_equal(ax2.dataLim.get_points(), ax1.dataLim.get_points())
+    assert np.array_equal(ax2.viewLim.get_points(), ax1.viewLim.get_points())
+
+    plt.close(fig)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
 @pytest.mark.mpl_image_compare
 def test_plot_atomic_density_line():
     """Test :func:`~macro_lightning.plot.plot_atomic_density_line`."""
@@ -68,8 +103,8 @@ def test_plot_atomic_density_line():
 
     plot.plot_atomic_density_line(m_arr)
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -87,8 +122,8 @@ def test_plot_nuclear_density_line():
 
     plot.plot_nuclear_density_line(m_arr)
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -106,8 +141,8 @@ def test_plot_black_hole_line():
 
     plot.plot_black_hole_line(m_arr)
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -125,8 +160,8 @@ def test_plot_reference_densities():
 
     plot.plot_reference_densities(m_arr)
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -137,6 +172,32 @@ def test_plot_reference_densities():
 # -------------------------------------------------------------------
 
 
+def test_update_reference_densities():
+    """Test :func:`~macro_lightning.plot.plot_reference_densities` updating.
+
+    Passing back the lines re-uses them with the new masses.
+
+    """
+    fig = plt.figure()
+    lines = plot.plot_reference_densities(m_arr)
+
+    new_m = np.logspace(2, 20)
+    new_lines = plot.plot_reference_densities(new_m, lines=lines)
+
+    assert all(new is old for new, old in zip(new_lines, lines))
+    assert len(fig.gca().lines) == 3
+    for line in new_lines:
+        assert np.array_equal(line.get_xdata(), new_m)
+
+    plt.close(fig)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
 @pytest.mark.mpl_image_compare
 def test_plot_mica_constraints():
     """Test :func:`~macro_lightning.plot.plot_mica_constraints`."""
@@ -145,8 +206,8 @@ def test_plot_mica_constraints():
     plot.plot_reference_densities(m_arr)
     plot.plot_mica_constraints()
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -165,8 +226,8 @@ def test_plot_white_dwarf_constraints():
     plot.plot_reference_densities(m_arr)
     plot.plot_white_dwarf_constraints()
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -185,8 +246,8 @@ def test_plot_cmb_constraints():
     plot.plot_reference_densities(m_arr)
     plot.plot_cmb_constraints(m_arr, sigmax=sigmax)
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -205,8 +266,8 @@ def test_plot_superbursts_constraints():
     plot.plot_reference_densities(m_arr)
     plot.plot_superbursts_constraints()
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -225,8 +286,8 @@ def test_plot_humandeath_constraints():
     plot.plot_reference_densities(m_arr)
     plot.plot_humandeath_constraints()
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -245,8 +306,8 @@ def test_plot_dfn_constraints():
     plot.plot_reference_densities(m_arr)
     plot.plot_dfn_constraints()
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -257,6 +318,42 @@ def test_plot_dfn_constraints():
 # -------------------------------------------------------------------
 
 
+def test_plot_constraints_given_data(monkeypatch):
+    """Test constraints given as arrays are plotted without loading data."""
+    from .. import data
+
+    points1, points2 = data.load_superbursts_polygons()
+    constraints = data.load_dfn_constraints()
+
+    def fail():
+        raise AssertionError("data should not be loaded")
+
+    for name in (
+        "load_superbursts_polygons",
+        "load_humandeath_constraints",
+        "load_dfn_constraints",
+    ):
+        monkeypatch.setattr(data, name, fail)
+
+    fig, ax = plt.subplots(figsize=(6, 4))
+
+    polys = plot.plot_superbursts_constraints(points1, points2)
+    human_fill = plot.plot_humandeath_constraints(*constraints)
+    dfn_fill = plot.plot_dfn_constraints(*constraints)
+
+    assert np.array_equal(polys[0].get_xy()[: len(points1)], points1)
+    assert np.array_equal(polys[1].get_xy()[: len(points2)], points2)
+    assert human_fill.axes is ax and dfn_fill.axes is ax
+
+    plt.close(fig)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
 @pytest.mark.mpl_image_compare
 def test_plot_lensing_constraints():
     """Test :func:`~macro_lightning.plot.plot_lensing_constraints`."""
@@ -265,8 +362,8 @@ def test_plot_lensing_constraints():
     plot.plot_reference_densities(m_arr)
     plot.plot_lensing_constraints(Mmicro=Mmicro)
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -277,6 +374,25 @@ def test_plot_lensing_constraints():
 # -------------------------------------------------------------------
 
 
+def test_lensing_default_masses():
+    """Test the precomputed default masses of the lensing constraints."""
+    from ..physics import black_hole, LMCTop
+
+    assert np.array_equal(plot._MMICRO, Mmicro)
+    assert np.array_equal(plot._MMICRO_BOUNDS[0], black_hole(Mmicro))
+    assert np.array_equal(plot._MMICRO_BOUNDS[1], LMCTop(Mmicro))
+
+    # shared between calls, so must not be modified
+    for arr in (plot._MMICRO, *plot._MMICRO_BOUNDS):
+        assert not arr.flags.writeable
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
 @pytest.mark.mpl_image_compare
 def test_plot_black_hole_constraints():
     """Test :func:`~macro_lightning.plot.plot_black_hole_constraints`."""
@@ -285,8 +401,8 @@ def test_plot_black_hole_constraints():
     plot.plot_reference_densities(m_arr)
     plot.plot_black_hole_constraints(m_arr, sigmin=sigmin)
 
-    plt.xlim([mmin, mmax])
-    plt.ylim([sigmin, sigmax])
+    ax.set_xlim(mmin, mmax)
+    ax.set_ylim(sigmin, sigmax)
 
     return fig
 
@@ -347,5 +463,253 @@ def test_full_constraints_plot():
 # -------------------------------------------------------------------
 
 
+def test_reused_constraints_plot():
+    """Test :func:`~macro_lightning.plot.constraints_plot` reusing axes.
+
+    Re-plotting on the axes of a full plot gives the empty plot.
+
+    """
+    with plot.constraints_plot(m_arr, all_constrs=True) as (fig, ax, *_):
+        pass
+
+    with plot.constraints_plot(m_arr, sigmin, sigmax, ax=ax) as (
+        refig,
+        reax,
+        *_,
+    ):
+        pass
+
+    assert refig is fig and reax is ax
+    assert len(ax.lines) == 3  # the reference densities
+    assert not ax.patches and not ax.collections
+    assert ax.get_ylim() == (sigmin, sigmax)
+    assert ax.get_xscale() == ax.get_yscale() == "log"
+
+    plt.close(fig)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_constraints_plot_no_reference():
+    """Test :func:`~macro_lightning.plot.constraints_plot` without lines."""
+    with plot.constraints_plot(m_arr, reference=False, bh_constr=True) as (
+        fig,
+        ax,
+        *_,
+    ):
+        pass
+
+    assert not ax.lines
+    assert len(ax.collections) == 1  # the black hole constraints
+    assert ax.get_legend() is None  # nothing is labeled
+
+    plt.close(fig)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_plot_on_given_axes():
+    """Test the plot functions draw on ``ax``, not the current axes."""
+    fig, (ax, other) = plt.subplots(1, 2)
+    plt.sca(other)
+
+    plot.plot_reference_densities(m_arr, ax=ax)
+    plot.plot_mica_constraints(ax=ax)
+    plot.plot_cmb_constraints(m_arr, sigmax, ax=ax)
+
+    assert len(ax.lines) == 3
+    assert len(ax.patches) == 1 and len(ax.collections) == 1
+    assert not other.lines and not other.patches and not other.collections
+
+    plt.close(fig)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_constraints_plot_backend(tmp_path):
+    """Test :func:`~macro_lightning.plot.constraints_plot` without pyplot."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fignums = plt.get_fignums()
+    savefig = tmp_path / "constraints.png"
+
+    with plot.constraints_plot(
+        m_arr, backend="agg", all_constrs=True, savefig=savefig
+    ) as (fig, ax, *_):
+        pass
+
+    assert isinstance(fig.canvas, FigureCanvasAgg)
+    assert plt.get_fignums() == fignums  # not managed by pyplot
+    assert ax.figure is fig and len(ax.lines) == 3
+    assert savefig.exists()
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_constraints_plot_unmanaged_axes():
+    """Test :func:`~macro_lightning.plot.constraints_plot` reuses ``ax``.
+
+    The axes are of a figure pyplot does not manage.
+
+    """
+    from matplotlib.figure import Figure
+
+    ax = Figure().add_subplot()
+
+    with plot.constraints_plot(m_arr, ax=ax, all_constrs=True) as (
+        fig,
+        got,
+        *_,
+    ):
+        pass
+
+    assert got is ax and fig is ax.figure
+    assert len(ax.lines) == 3
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_constraints_plot_xlim():
+    """Test the mass limits are the extrema, even if not monotonic."""
+    masses = np.array([1e10, 1e30, 1e2, 1e20])
+
+    with plot.constraints_plot(masses, backend="agg") as (fig, ax, *_):
+        pass
+
+    assert ax.get_xlim() == (1e2, 1e30)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_constraints_plot_reuse_artists():
+    """Test re-plotting on the same axes replaces only its own artists."""
+    with plot.constraints_plot(m_arr, backend="agg", all_constrs=True) as (
+        fig,
+        ax,
+        *_,
+    ):
+        mine = ax.axhline(1)  # the caller's
+
+    first = list(ax.macro_constraints)
+    assert len(first) == 12  # 3 lines, 4 polygons, 5 fills
+    ax.xaxis.label.set_fontsize(10)  # a customized label
+
+    with plot.constraints_plot(m_arr, ax=ax, CMB_constr=True) as (
+        refig,
+        reax,
+        *_,
+    ):
+        pass
+
+    assert refig is fig and reax is ax
+    assert ax.macro_constraints == first[:3] + first[5:6]  # lines and CMB
+    assert all(artist.axes is None for artist in first[3:5] + first[6:])
+    assert mine in ax.lines  # the caller's are kept
+    assert ax.xaxis.label.get_fontsize() == 10  # not set up again
+
+
+# /def
+
+# -------------------------------------------------------------------
+
+
+def test_constraints_plot_update_in_place():
+    """Test re-plotting on the same axes updates the artists in place."""
+    kw = dict(backend="agg", CMB_constr=True, mica_constr=True)
+    with plot.constraints_plot(m_arr, bh_constr=True, **kw) as (fig, ax, *_):
+        mine = ax.axhline(1)  # the caller's
+
+    artists = list(ax.macro_constraints)
+    lines, cmb, bh = artists[:3], artists[4], artists[5]
+    assert len(artists) == 6 and artists[3] in ax.patches  # mica
+
+    new_m = np.logspace(2, 20, 30)
+    with plot.constraints_plot(new_m, ax=ax, **kw) as (refig, reax, *_):
+        pass
+
+    assert refig is fig and reax is ax
+    assert ax.macro_constraints == artists[:5]  # the same artists
+    assert bh.axes is None  # not re-plotted, so removed
+    assert mine in ax.lines  # the caller's are kept
+    assert np.array_equal(lines[0].get_xdata(), new_m)
+    assert np.array_equal(cmb.get_paths()[0].vertices[1:31, 0], new_m)
+    assert ax.get_xlim() == (new_m.min(), new_m.max())
+
+    # artists removed by the caller are drawn anew
+    cmb.remove()
+    with plot.constraints_plot(new_m, ax=ax, **kw):
+        pass
+
+    assert ax.macro_constraints[:4] == artists[:4]
+    assert ax.macro_constraints[4] is not cmb
+    assert ax.macro_constraints[4] in ax.collections
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+def test_constraints_plot_blit():
+    """Test the ``redraw`` of :func:`~macro_lightning.plot.constraints_plot`.
+
+    Each redraw restores the cached constraints, then draws the artist.
+
+    """
+    with plot.constraints_plot(m_arr, blit=True, backend="agg") as (
+        fig,
+        ax,
+        *_,
+        redraw,
+    ):
+        (line,) = ax.loglog(m_arr, m_arr, color="r")
+
+        redraw([line])
+        first = np.array(fig.canvas.buffer_rgba())
+
+        line.set_ydata(m_arr[::-1])
+        redraw([line])
+        second = np.array(fig.canvas.buffer_rgba())
+
+        line.set_ydata(m_arr)
+        redraw([line])
+        third = np.array(fig.canvas.buffer_rgba())
+
+    assert line.get_animated()
+    assert not np.array_equal(first, second)
+    assert np.array_equal(first, third)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
 ##############################################################################
 # END
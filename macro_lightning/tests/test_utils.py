@@ -43,12 +43,12 @@ def test_as_quantity():
     # single number
     x = 1 * u.m
     y = utils.as_quantity(x)
-    assert y == x
+    assert y is x
 
     # array
     x = [1, 2] * u.m
     y = utils.as_quantity(x)
-    assert all(y == x)
+    assert np.array_equal(y, x)
 
     # ------------------
     # Change Copies
@@ -56,11 +56,11 @@ def test_as_quantity():
     # array
     x = [1, 2, 3] * u.m
     y = utils.as_quantity(x)
-    assert all(y == x)
+    assert np.array_equal(y, x)
 
     # changed
     x[0] = 0 * u.m
-    assert all(y == x)
+    assert np.array_equal(y, x)
 
     # ------------------
     # Recast arrays
@@ -68,12 +68,12 @@ def test_as_quantity():
     # array
     x = [1 * u.m, 2 * u.m, 3 * u.m]
     y = utils.as_quantity(x)
-    assert all(y == [1, 2, 3] * u.m)
+    assert np.array_equal(y, [1, 2, 3] * u.m)
 
     # array, with conversion
     x = [1 * u.m, 200 * u.cm, 3 * u.m]
     y = utils.as_quantity(x)
-    assert all(y == [1, 2, 3] * u.m)
+    assert np.array_equal(y, [1, 2, 3] * u.m)
 
     # ------------------
     # Failure Tests
@@ -99,6 +99,21 @@ def test_qsquare():
     y = utils.qsquare(x)
     assert y == x ** 2
 
+    # the arguments are stacked along a leading axis, even if only one
+    y = utils.qsquare([1, 2] * u.m)
+    assert y.shape == (1, 2)
+    assert np.array_equal(utils.qsquare(x, 3 * u.m), [4, 9] * u.m ** 2)
+
+    # into a buffer
+    out = np.empty(1) * u.m ** 2
+    y = utils.qsquare(x, out=out)
+    assert y is out
+    assert out == x ** 2
+
+    # function units are not squared
+    with pytest.raises(u.UnitTypeError):
+        utils.qsquare(u.Magnitude([1.0, 2.0]))
+
 
 # /def
 
@@ -123,6 +138,13 @@ def test_qnorm():
     y = utils.qnorm(x)
     assert y == 5 * u.m
 
+    # with arguments
+    y = utils.qnorm(x, axis=-1)
+    assert y == [5] * u.m
+
+    y = utils.qnorm([3, 0] * u.m, ord=0, axis=-1)
+    assert y == 1 * u.one
+
 
 # /def
 
@@ -143,16 +165,18 @@ def test_qarange():
     step = 1 * u.m
 
     expected = np.arange(1, 10, 1) * u.m
-    assert all(utils.qarange(start, stop, step) == expected)
+    assert np.array_equal(utils.qarange(start, stop, step), expected)
 
     # change unit
     expected = np.arange(1, 10, 1) * 100 * u.cm
-    assert all(utils.qarange(start, stop, step, unit=u.cm) == expected)
+    assert np.array_equal(
+        utils.qarange(start, stop, step, unit=u.cm), expected
+    )
 
     # change step
     step = 1 * u.cm
     expected = np.arange(100, 1000, 1) * u.cm
-    assert all(utils.qarange(start, stop, step) == expected)
+    assert np.array_equal(utils.qarange(start, stop, step), expected)
 
     # raise error
     with pytest.raises(AttributeError):
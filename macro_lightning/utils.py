@@ -18,7 +18,7 @@ __all__ = [
 
 # THIRD PARTY
 
-from astropy.units import Quantity
+from astropy.units import Quantity, UnitBase
 
 import numpy as np
 from numpy.linalg import norm
@@ -38,6 +38,9 @@ def as_quantity(arg):
 
     from :mod:`~astropy.utils`.
 
+    For performance, pass ndarray-backed Quantities: Python lists, and
+    especially lists of Quantities, are coerced element by element.
+
     Returns
     -------
     Quantity
@@ -49,6 +52,9 @@ def as_quantity(arg):
         if Quantity() fails
 
     """
+    if isinstance(arg, Quantity):  # skip the constructor
+        return arg
+
     try:
         return Quantity(arg, copy=False, subok=True)
     except Exception:
@@ -60,9 +66,30 @@ def as_quantity(arg):
 # -------------------------------------------------------------------
 
 
+def _stack_args(args):
+    """:func:`~as_quantity` of the tuple ``args``.
+
+    A single Quantity is given the leading length-1 axis as a view,
+    skipping the tuple parse.
+
+    """
+    if len(args) == 1 and isinstance(args[0], Quantity):
+        return args[0][np.newaxis]
+
+    return as_quantity(args)
+
+
+# /def
+
+# -------------------------------------------------------------------
+
+
 def qsquare(*args, **kw):
     """Quantity, Squared.
 
+    The square is taken of the underlying array, skipping the Quantity
+    ufunc machinery, unless ``out`` is given.
+
     Parameters
     ----------
     *args : Quantity
@@ -73,15 +100,23 @@ def qsquare(*args, **kw):
     Returns
     -------
     Quantity
-        not copied, quantity subclasses passed through.
+        a plain Quantity, not a subclass, unless ``out`` is given.
 
     Raises
     ------
     NotImplementedError
         if :func:`~as_quantity` fails
+    UnitTypeError
+        if the unit is a function unit, e.g. a magnitude
 
     """
-    return np.square(as_quantity(args), **kw)
+    q = _stack_args(args)
+
+    # let Quantity set the unit of `out` and validate function units
+    if "out" in kw or not isinstance(q.unit, UnitBase):
+        return np.square(q, **kw)
+
+    return Quantity(np.square(q.value, **kw), q.unit ** 2, copy=False)
 
 
 # /def
@@ -102,7 +137,7 @@ def qnorm(*args, **kw):
     Returns
     -------
     Quantity
-        not copied, quantity subclasses passed through.
+        a plain Quantity, not a subclass, for ordinary units.
 
     Raises
     ------
@@ -110,7 +145,15 @@ def qnorm(*args, **kw):
         if :func:`~as_quantity` fails
 
     """
-    return norm(as_quantity(args), **kw)
+    q = _stack_args(args)
+
+    # ord=0 counts the non-zero elements, so is dimensionless, and function
+    # units, e.g. magnitudes, are left to Quantity
+    if kw.get("ord") == 0 or not isinstance(q.unit, UnitBase):
+        return norm(q, **kw)
+
+    # normed on the underlying array, skipping the Quantity dispatch
+    return Quantity(norm(q.value, **kw), q.unit, copy=False)
 
 
 # /def
@@ -135,7 +178,7 @@ def qarange(start, stop, step, unit=None):
         start.to_value(unit), stop.to_value(unit), step.to_value(unit)
     )
 
-    return arng * unit
+    return Quantity(arng, unit, copy=False)
 
 
 # /def
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# see LICENSE.rst
+
+"""Build the binary data files.
+
+The text files in :mod:`macro_lightning.data` are the ground truth. This
+script converts the polygons to ``.npy`` files, which the loaders
+memory-map at runtime, and the ECSV constraints to ``.npz`` files. Re-run
+it, with the package installed (``pip install -e .``), whenever a text file
+changes::
+
+    python scripts/build_data.py
+
+"""
+
+__author__ = "Nathaniel Starkman"
+
+
+##############################################################################
+# IMPORTS
+
+# THIRD PARTY
+
+import numpy as np
+
+
+# PROJECT-SPECIFIC
+
+from macro_lightning.data import _data_dir, _ecsv_columns, _read_text_array
+
+
+##############################################################################
+# PARAMETERS
+
+# text file name : keyword arguments for ``_read_text_array``
+_POLYGONS = {
+    "mica_polygon.txt": dict(delimiter=",", skiprows=1),
+    "superbursts1_polygon.txt": {},
+    "superbursts2_polygon.txt": {},
+    "whitedwarf_polygon.txt": {},
+}
+
+_CONSTRAINTS = (
+    "humandeath_constraints.ecsv",
+    "dfn_constraints.ecsv",
+    "dfn_future_constraints.ecsv",
+)
+
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+def build_polygons():
+    """Convert the polygon text files to ``.npy``."""
+    for name, kwargs in _POLYGONS.items():
+        path = _data_dir.joinpath(name)
+        # C order, so the memory-mapped vertices need no copy when plotted
+        points = np.ascontiguousarray(_read_text_array(path, **kwargs))
+        np.save(path.with_suffix(".npy"), points, allow_pickle=False)
+
+
+# /def
+
+
+def build_constraints():
+    """Convert the ECSV constraint files to ``.npz``."""
+    for name in _CONSTRAINTS:
+        path = _data_dir.joinpath(name)
+        mass, xsec, upper = _ecsv_columns(
+            path, ("mass", "cross-section", "upper-lim")
+        )
+        np.savez(path.with_suffix(".npz"), mass=mass, xsec=xsec, upper=upper)
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+
+    build_polygons()
+    build_constraints()
+
+
+##############################################################################
+# END